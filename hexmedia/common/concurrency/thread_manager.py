@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import atexit
+import itertools
 import logging
+import queue
 import time
 import threading
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass, field
 from typing import Callable, Generator, Generic, Iterable, List, Optional, Tuple, TypeVar
 
 T = TypeVar("T")
@@ -12,23 +16,247 @@ R = TypeVar("R")
 
 log = logging.getLogger(__name__)
 
+# Smoothing factor for the adaptive prefetch timings in imap_unordered
+_EMA_ALPHA = 0.2
+
+
+def _ema(prev: Optional[float], x: float, alpha: float = _EMA_ALPHA) -> float:
+    return x if prev is None else prev + alpha * (x - prev)
+
 
 @dataclass
 class ThreadStats:
-    start_ts: float
+    start_ts: float = field(default_factory=time.monotonic)  # monotonic clock, not wall-clock
     tasks_submitted: int = 0
     tasks_completed: int = 0
     tasks_failed: int = 0
 
     @property
     def uptime_sec(self) -> float:
-        return time.time() - self.start_ts
+        return time.monotonic() - self.start_ts
 
     @property
     def in_flight(self) -> int:
         return max(0, self.tasks_submitted - (self.tasks_completed + self.tasks_failed))
 
 
+class _Counter:
+    """
+    Lock-free increment counter.
+
+    next() on an itertools.count is atomic under the GIL, so increments from
+    worker threads need no lock. Reads are rare (stats snapshots) and pay for a
+    small lock instead: each read also advances the underlying count, so we
+    track how many reads happened and subtract them.
+    """
+
+    __slots__ = ("_it", "_reads", "_read_lock")
+
+    def __init__(self) -> None:
+        self._it = itertools.count()
+        self._reads = 0
+        self._read_lock = threading.Lock()
+
+    def inc(self) -> None:
+        next(self._it)
+
+    @property
+    def value(self) -> int:
+        with self._read_lock:
+            v = next(self._it) - self._reads
+            self._reads += 1
+        return v
+
+
+_STOP = object()  # per-worker shutdown sentinel
+_WAKE = object()  # nudges a parked worker to look for stealable work
+
+
+class _WorkItem:
+    __slots__ = ("future", "fn", "args", "kwargs")
+
+    def __init__(self, future: Future, fn: Callable, args: tuple, kwargs: dict) -> None:
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+
+    def run(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            res = self.fn(*self.args, **self.kwargs)
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(res)
+
+
+class _Parked:
+    """
+    Indices of workers blocked on their own (empty) queue.
+
+    A worker registers here, re-checks every queue, and only then blocks. submit() queues
+    its item first and then reads the set, so either it sees the worker parked and wakes
+    it, or the worker's re-check sees the item: no wakeup is lost.
+    """
+
+    __slots__ = ("_idx", "_lock")
+
+    def __init__(self) -> None:
+        self._idx: set[int] = set()
+        self._lock = threading.Lock()
+
+    def park(self, idx: int) -> None:
+        with self._lock:
+            self._idx.add(idx)
+
+    def unpark(self, idx: int) -> None:
+        with self._lock:
+            self._idx.discard(idx)
+
+    def wake_for(self, target: int, queues: List["queue.SimpleQueue"]) -> None:
+        """An item just landed on queues[target]: wake a parked worker to steal it."""
+        if not self._idx:  # common case while busy: nobody parked, no lock taken
+            return
+        with self._lock:
+            if target in self._idx or not self._idx:
+                return  # the item itself wakes its owner
+            idx = self._idx.pop()
+        queues[idx].put(_WAKE)
+
+
+def _take(own: "queue.SimpleQueue", others: List["queue.SimpleQueue"]):
+    """Non-blocking: next item from our own queue, else one stolen from a neighbour, else None."""
+    try:
+        return own.get_nowait()
+    except queue.Empty:
+        pass
+    for q in others:
+        try:
+            item = q.get_nowait()
+        except queue.Empty:
+            continue
+        if item is _STOP or item is _WAKE:  # not ours to consume; hand it back to its owner
+            q.put(item)
+            continue
+        return item
+    return None
+
+
+def _worker(
+    idx: int,
+    queues: List["queue.SimpleQueue"],
+    slots: Optional[threading.Semaphore],
+    parked: _Parked,
+) -> None:
+    # Module-level on purpose: workers hold no reference to the pool/manager,
+    # so an abandoned ThreadManager can still be collected (and finalized).
+    own = queues[idx]
+    n = len(queues)
+    others = [queues[(idx + k) % n] for k in range(1, n)]
+    while True:
+        item = _take(own, others)
+        if item is None:
+            parked.park(idx)
+            item = _take(own, others)  # re-check now that submit() can see us parked
+            if item is None:
+                item = own.get()  # blocks until our own work, a _WAKE or _STOP arrives
+            parked.unpark(idx)
+        if item is _WAKE:
+            continue
+        if item is _STOP:
+            return
+        if slots is not None:
+            slots.release()
+        item.run()
+        del item
+
+
+class _StealingPool:
+    """
+    Minimal thread pool with one SimpleQueue per worker, replacing ThreadPoolExecutor's
+    single shared, lock-protected queue.Queue on the dispatch path.
+
+    submit() deals items round-robin. A worker drains its own queue first and, when that
+    runs dry, steals from its neighbours before parking. Parked workers block on their own
+    queue; when an item lands behind a busy worker, submit() posts a _WAKE to one parked
+    worker so that backlog still gets stolen.
+
+    With max_queue set, a semaphore caps *pending* items (submitted, not yet dequeued):
+    submit() blocks until a worker picks something up.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str, max_queue: Optional[int] = None) -> None:
+        self._max_workers = max_workers
+        self._prefix = thread_name_prefix
+        self._queues: List["queue.SimpleQueue"] = [queue.SimpleQueue() for _ in range(max_workers)]
+        self._rr = itertools.count()
+        self._slots = threading.Semaphore(max_queue) if max_queue else None
+        self._parked = _Parked()
+        self._threads: List[threading.Thread] = []
+        # Guards start-up, the shutdown flag and enqueueing: an item is either queued
+        # ahead of the _STOP sentinels or rejected (cf. ThreadPoolExecutor._shutdown_lock)
+        self._shutdown_lock = threading.Lock()
+        self._shutdown = False
+
+    def _start_locked(self) -> None:
+        # Threads are spawned lazily on first submit, like ThreadPoolExecutor
+        threads = [
+            threading.Thread(
+                target=_worker,
+                args=(i, self._queues, self._slots, self._parked),
+                name=f"{self._prefix}_{i}",
+                daemon=True,
+            )
+            for i in range(self._max_workers)
+        ]
+        for t in threads:
+            t.start()
+        self._threads = threads
+
+    def submit(self, fn: Callable[..., R], /, *args, **kwargs) -> Future[R]:
+        if self._shutdown:
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        if self._slots is not None:
+            self._slots.acquire()  # backpressure: wait for a worker to dequeue (not under the lock)
+        fut: Future[R] = Future()
+        with self._shutdown_lock:
+            if self._shutdown:
+                if self._slots is not None:
+                    self._slots.release()
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if not self._threads:
+                self._start_locked()
+            i = next(self._rr) % self._max_workers
+            self._queues[i].put(_WorkItem(fut, fn, args, kwargs))
+        self._parked.wake_for(i, self._queues)
+        return fut
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        with self._shutdown_lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+        if cancel_futures:
+            for q in self._queues:
+                while True:
+                    try:
+                        item = q.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is _WAKE:
+                        continue
+                    item.future.cancel()
+                    if self._slots is not None:
+                        self._slots.release()
+        for q in self._queues:
+            q.put(_STOP)  # after any remaining items, so those still run
+        if wait:
+            for t in self._threads:
+                t.join()
+
+
 class ThreadManager(Generic[T, R]):
     """
     A reusable, bounded thread-pool manager focused on I/O-bound workloads.
@@ -38,7 +266,8 @@ class ThreadManager(Generic[T, R]):
     - submit(fn, *args, **kwargs) -> Future
     - imap_unordered(fn, iterable, prefetch=None) -> yields results as they finish
     - map(fn, iterable, preserve_order=True) -> List[R]
-    - Bounded outstanding tasks via a semaphore (max_queue)
+    - Work-stealing pool: one SimpleQueue per worker, no shared queue lock on dispatch
+    - Bounded pending tasks (max_queue)
     - Stop event accessible by tasks (optional)
     - Stats snapshot
     - Clean shutdown, context manager support
@@ -64,7 +293,9 @@ class ThreadManager(Generic[T, R]):
         max_workers:
             Max threads in the pool. Default: auto for I/O (~min(8, max(4, 2*CPUs))).
         max_queue:
-            Max number of *outstanding* tasks (submitted but not finished).
+            Max number of *pending* tasks (submitted but not yet picked up by a worker);
+            submit() blocks while the queue is full. At most max_queue + max_workers
+            tasks are outstanding at once.
             If None or <= 0, it's effectively unbounded (not recommended for very large workloads).
         thread_name_prefix:
             Prefix for thread names.
@@ -76,22 +307,25 @@ class ThreadManager(Generic[T, R]):
             n = os.cpu_count() or 4
             max_workers = max(4, min(8, n * 2))  # I/O-friendly default
 
+        # Bounded outstanding-tasks controller
+        self._max_queue = max_queue if max_queue and max_queue > 0 else None
+
         self._name = name
-        self._executor = ThreadPoolExecutor(
+        self._max_workers = max_workers
+        self._pool = _StealingPool(
             max_workers=max_workers,
             thread_name_prefix=thread_name_prefix or f"{name}",
+            max_queue=self._max_queue,
         )
+        # Abandoned without shutdown(): let the workers exit once we're collected
+        self._finalizer = weakref.finalize(self, self._pool.shutdown, False)
         self._stop = threading.Event()
-        self._stats = ThreadStats(start_ts=time.time())
+        self._start_ts = time.monotonic()
+        self._submitted = _Counter()
+        self._completed = _Counter()
+        self._failed = _Counter()
         self._log_exceptions = log_exceptions
 
-        # Bounded outstanding-tasks controller
-        if not max_queue or max_queue <= 0:
-            self._slots = None  # unbounded
-        else:
-            # slots = how many tasks can be outstanding at once
-            self._slots = threading.Semaphore(max_queue)
-
         self._closed = False
         self._lock = threading.Lock()
 
@@ -99,13 +333,14 @@ class ThreadManager(Generic[T, R]):
     # Lifecycle
     # -------------------------
     def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
-        """Shut down the executor. Safe to call multiple times."""
+        """Shut down the pool. Safe to call multiple times."""
         with self._lock:
             if self._closed:
                 return
             self._closed = True
             self._stop.set()
-        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+        self._finalizer.detach()
+        self._pool.shutdown(wait=wait, cancel_futures=cancel_futures)
 
     def __enter__(self) -> "ThreadManager[T, R]":
         return self
@@ -120,13 +355,12 @@ class ThreadManager(Generic[T, R]):
 
     def stats(self) -> ThreadStats:
         """Return a *snapshot* of current stats."""
-        with self._lock:
-            return ThreadStats(
-                start_ts=self._stats.start_ts,
-                tasks_submitted=self._stats.tasks_submitted,
-                tasks_completed=self._stats.tasks_completed,
-                tasks_failed=self._stats.tasks_failed,
-            )
+        return ThreadStats(
+            start_ts=self._start_ts,
+            tasks_submitted=self._submitted.value,
+            tasks_completed=self._completed.value,
+            tasks_failed=self._failed.value,
+        )
 
     # -------------------------
     # Submission
@@ -139,47 +373,25 @@ class ThreadManager(Generic[T, R]):
         if self._closed:
             raise RuntimeError(f"{self._name}: submit() after shutdown")
 
-        # Apply backpressure if bounded
-        if self._slots is not None:
-            self._slots.acquire()
-
         def _wrapped(*a, **kw) -> R:
+            # Completion accounting runs here, on the worker, instead of in a
+            # done-callback: no extra closure/callback per task and no second
+            # result() re-raise just to classify the outcome.
             try:
-                return fn(*a, **kw)
-            finally:
-                # release slot when the callable *finishes*, success or error
-                if self._slots is not None:
-                    self._slots.release()
-
-        with self._lock:
-            self._stats.tasks_submitted += 1
-
-        fut: Future[R] = self._executor.submit(_wrapped, *args, **kwargs)
-
-        if self._log_exceptions:
-            def _cb(f: Future[R]) -> None:
-                try:
-                    _ = f.result()
-                    with self._lock:
-                        self._stats.tasks_completed += 1
-                except Exception as e:
-                    with self._lock:
-                        self._stats.tasks_failed += 1
+                res = fn(*a, **kw)
+            except Exception as e:
+                self._failed.inc()
+                if self._log_exceptions:
                     log.exception("%s task failed: %s", self._name, e)
+                raise
+            else:
+                self._completed.inc()
+                return res
 
-            fut.add_done_callback(_cb)
-        else:
-            def _cb2(f: Future[R]) -> None:
-                try:
-                    _ = f.result()
-                    with self._lock:
-                        self._stats.tasks_completed += 1
-                except Exception:
-                    with self._lock:
-                        self._stats.tasks_failed += 1
-
-            fut.add_done_callback(_cb2)
+        self._submitted.inc()
 
+        # Blocks while the pending queue is full, if bounded (backpressure)
+        fut: Future[R] = self._pool.submit(_wrapped, *args, **kwargs)
         return fut
 
     # -------------------------
@@ -195,7 +407,13 @@ class ThreadManager(Generic[T, R]):
         """
         Submit items from 'iterable' and yield results as they complete (unordered).
         'prefetch' controls how many tasks we keep in flight in addition to max_workers.
-        If bounded by max_queue, that also applies.
+        If bounded by max_queue, submit() backpressure also applies.
+
+        When 'prefetch' is None the depth is adaptive: it starts at 2x workers and
+        moves one step per result between max_workers and max_queue (or 8x workers),
+        growing while the pool delivers results slower than the caller consumes them
+        (task run time / workers vs. the caller's time per result, e.g. probes on
+        network storage) and shrinking when the caller is the slower side.
 
         This is great for big inputs without materializing all futures at once.
         """
@@ -205,29 +423,71 @@ class ThreadManager(Generic[T, R]):
         # Calculate how many to keep inflight
         # If queue is unbounded, use a modest default prefetch (2x workers)
         # If bounded, we'll respect the semaphore anyway.
-        workers = getattr(self._executor, "_max_workers", 4)
+        workers = self._max_workers
+        adaptive = prefetch is None
         if prefetch is None:
             prefetch = workers * 2
-
-        inflight: List[Future[R]] = []
+        lo = workers
+        hi = max(lo, self._max_queue or workers * 8)
+
+        # Futures report in via a completion queue as they finish, so each
+        # completion is O(1) regardless of how many tasks are in flight.
+        done_q: "queue.SimpleQueue[Tuple[Future[R], float]]" = queue.SimpleQueue()
+        # run-start time per task, recorded on the worker: queue wait grows with the window
+        # itself, so timing from submit() would feed back into ever-larger windows
+        started_at: dict[Future[R], List[float]] = {}
+        outstanding = 0
         it = iter(iterable)
 
+        def _on_done(f: Future[R]) -> None:
+            done_q.put((f, time.monotonic()))
+
+        def _timed(item: T, started: List[float]) -> R:
+            started.append(time.monotonic())
+            return fn(item)
+
         # Prime the pump
         def _fill() -> None:
-            while len(inflight) < (workers + prefetch):
+            nonlocal outstanding
+            while outstanding < (workers + prefetch):
                 try:
                     item = next(it)
                 except StopIteration:
                     break
-                inflight.append(self.submit(fn, item))
+                if adaptive:
+                    started: List[float] = []
+                    fut = self.submit(_timed, item, started)
+                    started_at[fut] = started
+                else:
+                    fut = self.submit(fn, item)
+                fut.add_done_callback(_on_done)
+                outstanding += 1
+
+        ema_task: Optional[float] = None  # run start -> done, per task
+        ema_gap: Optional[float] = None   # time the caller spends between results
 
         _fill()
-        while inflight:
-            for done in as_completed(inflight, timeout=None):
-                inflight.remove(done)
-                # Pass through the result/raise; caller decides how to handle
-                yield done.result()
-                _fill()
+        while outstanding:
+            done, done_ts = done_q.get()
+            outstanding -= 1
+            if adaptive:
+                started = started_at.pop(done, None)
+                if started:  # empty if it was cancelled before running
+                    ema_task = _ema(ema_task, done_ts - started[0])
+                if ema_task is not None and ema_gap is not None:
+                    # the pool hands back a result every ema_task / workers on average
+                    per_result = ema_task / workers
+                    if per_result > ema_gap:
+                        prefetch = min(hi, prefetch + 1)
+                    elif per_result < ema_gap:
+                        prefetch = max(lo, prefetch - 1)
+            # Top up before handing control back so workers stay busy while the caller runs
+            _fill()
+            handed_out = time.monotonic()
+            # Pass through the result/raise; caller decides how to handle
+            yield done.result()
+            if adaptive:
+                ema_gap = _ema(ema_gap, time.monotonic() - handed_out)
 
     def map(
         self,
@@ -238,11 +498,48 @@ class ThreadManager(Generic[T, R]):
     ) -> List[R]:
         """
         Convenience wrapper: returns a list of results.
-        If preserve_order=False, uses imap_unordered for speed / lower memory.
+        Both modes stream through imap_unordered's bounded in-flight window, so only
+        a window's worth of Futures exists at a time. With preserve_order=True the
+        results are slotted back into input order as they arrive.
         """
-        if preserve_order:
-            # Submit all (bounded by max_queue if set), then block for results in order
-            futures_list = [self.submit(fn, item) for item in iterable]
-            return [f.result() for f in futures_list]
-        else:
+        if not preserve_order:
             return list(self.imap_unordered(fn, iterable))
+
+        out: List[R] = []
+        early: dict[int, R] = {}  # finished ahead of their turn
+        for idx, res in self.imap_unordered(lambda pair: (pair[0], fn(pair[1])), enumerate(iterable)):
+            early[idx] = res
+            while len(out) in early:
+                out.append(early.pop(len(out)))
+        return out
+
+
+# One pool per role, never evicted: each lives until interpreter exit
+_managers: dict[str, ThreadManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_thread_manager(
+    name: str,
+    max_workers: Optional[int] = None,
+    max_queue: Optional[int] = None,
+    log_exceptions: bool = True,
+) -> ThreadManager:
+    """
+    Process-wide ThreadManager per role name, e.g. one each for scan/hash/ffprobe/thumbs.
+    The pool is created once, sized by the first caller's arguments, and reused across
+    requests; later calls return it whatever sizing they pass. It is shut down at
+    interpreter exit: callers must not call shutdown() on it or use it as a context manager.
+    """
+    with _managers_lock:
+        tm = _managers.get(name)
+        if tm is None:
+            tm = ThreadManager(
+                name=name,
+                max_workers=max_workers,
+                max_queue=max_queue,
+                log_exceptions=log_exceptions,
+            )
+            atexit.register(tm.shutdown, wait=False, cancel_futures=True)
+            _managers[name] = tm
+    return tm
@@ -0,0 +1,33 @@
+# hexmedia/common/ids.py
+from __future__ import annotations
+
+import os
+import time
+import uuid
+
+try:  # optional: Rust-backed generator (returns stdlib uuid.UUID via the compat module)
+    from uuid_utils.compat import uuid7 as _uuid7_ext
+except ImportError:  # pragma: no cover - optional dependency
+    _uuid7_ext = None
+
+
+def _uuid7_py() -> uuid.UUID:
+    # RFC 9562 layout: 48-bit unix ms | ver(4)=7 | rand_a(12) | var(2)=0b10 | rand_b(62)
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76
+    value |= (rand >> 62 & 0xFFF) << 64
+    value |= 0b10 << 62
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF
+    return uuid.UUID(int=value)
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (version 7). IDs generated close together sort close together,
+    so btree primary keys append to the rightmost leaf instead of a random page.
+    """
+    if _uuid7_ext is not None:
+        return _uuid7_ext()
+    return _uuid7_py()
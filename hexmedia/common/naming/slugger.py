@@ -8,14 +8,32 @@ import re
 import unicodedata
 
 DEFAULT_ALPHABET = string.ascii_lowercase  # 'a'..'z'
+_POOL_TUPLE = tuple(DEFAULT_ALPHABET)
 
 
 def random_slug(length: int = 7, alphabet: Iterable[str] = DEFAULT_ALPHABET) -> str:
     """Generate a short, filesystem-friendly slug (default: 7 lowercase letters)."""
-    pool = tuple(alphabet)
-    return "".join(secrets.choice(pool) for _ in range(length))
+    pool = _POOL_TUPLE if alphabet is DEFAULT_ALPHABET else tuple(alphabet)
+    n = len(pool)
+    if not 0 < n <= 256:
+        return "".join(secrets.choice(pool) for _ in range(length))
 
-_slug_re = re.compile(r"[^a-z0-9]+")
+    # One urandom read per batch instead of per character. Bytes at or above the
+    # largest multiple of n are rejected so `b % n` stays uniform (no modulo bias).
+    limit = 256 - (256 % n)
+    out: list[str] = []
+    while len(out) < length:
+        for b in secrets.token_bytes((length - len(out)) * 2):
+            if b < limit:
+                out.append(pool[b % n])
+                if len(out) == length:
+                    break
+    return "".join(out)
+
+# ASCII path: map every byte outside [a-z0-9] to '-' with one table lookup each,
+# then collapse runs of '-' (the only part that still needs the regex engine)
+_SLUG_TRANS = bytes(i if (0x30 <= i <= 0x39 or 0x61 <= i <= 0x7A) else 0x2D for i in range(256))
+_dash_run_re = re.compile(rb"-{2,}")
 _slug_re_unicode = re.compile(r"\s+")
 
 def slugify(text: str, *, max_len: int = 64, allow_unicode: bool = False) -> str:
@@ -46,10 +64,11 @@ def slugify(text: str, *, max_len: int = 64, allow_unicode: bool = False) -> str
         value = _slug_re_unicode.sub("-", value)
         value = value.strip("-")
     else:
-        # Normalize to ASCII
-        value = unicodedata.normalize("NFKD", value)
-        value = value.encode("ascii", "ignore").decode("ascii")
-        value = _slug_re.sub("-", value).strip("-")
+        # Normalize to ASCII; pure-ASCII input (the common case) is already NFKD-stable
+        if not value.isascii():
+            value = unicodedata.normalize("NFKD", value)
+        raw = value.encode("ascii", "ignore").translate(_SLUG_TRANS)
+        value = _dash_run_re.sub(b"-", raw).strip(b"-").decode("ascii")
 
     if max_len > 0 and len(value) > max_len:
         value = value[:max_len].rstrip("-")
@@ -2,27 +2,47 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
-def resolve_root(root: Path | str) -> Path:
-    """Resolve a project/media root directory."""
+@lru_cache(maxsize=128)
+def _resolve_root_cached(root: str) -> Path:
     return Path(root).expanduser().resolve()
 
 
-def safe_join(root: Path | str, rel: Path | str) -> Path:
+def resolve_root(root: Path | str) -> Path:
+    """
+    Resolve a project/media root directory.
+    Memoized per absolute root: roots are constant for the life of the process, so
+    the lstat walk in resolve() runs once per root rather than once per join. The key
+    is made absolute first (against the current cwd/HOME), so a relative or '~' root
+    still resolves correctly after a chdir or HOME change.
+    """
+    return _resolve_root_cached(os.path.abspath(os.path.expanduser(str(root))))
+
+
+def _is_inside(p: Path, r: Path) -> bool:
+    # Pure string work on two already-resolved absolute paths; no syscalls
+    return os.path.commonpath([str(p), str(r)]) == str(r)
+
+
+def safe_join(root: Path | str, rel: Path | str, *, follow_symlinks: bool = True) -> Path:
     """
     Join 'root' and a relative path safely, ensuring the result stays inside 'root'.
     Raises ValueError if traversal escapes the root.
+
+    With follow_symlinks=False the joined path is only normalized lexically (no
+    stat calls), so a symlink under 'root' pointing elsewhere is NOT caught. Use it
+    for paths produced by our own scan of 'root'; keep the default at API boundaries.
     """
     r = resolve_root(root)
-    p = (r / str(rel)).resolve()
-    try:
-        p.relative_to(r)  # type: ignore[attr-defined]
-    except Exception as exc:
-        # Fallback for older Python if needed
-        if not str(p).startswith(str(r) + os.sep):
-            raise ValueError(f"path {p} escapes root {r}") from exc
+    if follow_symlinks:
+        p = (r / str(rel)).resolve()
+    else:
+        p = Path(os.path.normpath(os.path.join(str(r), str(rel))))
+    if not _is_inside(p, r):
+        raise ValueError(f"path {p} escapes root {r}")
     return p
 
 
@@ -30,8 +50,5 @@ def ensure_inside(path: Path | str, root: Path | str) -> None:
     """Validate that 'path' is inside 'root'. Raises ValueError if not."""
     p = Path(path).resolve()
     r = resolve_root(root)
-    try:
-        p.relative_to(r)  # type: ignore[attr-defined]
-    except Exception:
-        if not str(p).startswith(str(r) + os.sep):
-            raise ValueError(f"path {p} escapes root {r}")
+    if not _is_inside(p, r):
+        raise ValueError(f"path {p} escapes root {r}")
@@ -2,11 +2,33 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
-import json
+import logging
+import os
 import shlex
+import sqlite3
 import subprocess
+import tempfile
+import threading
+
+import orjson
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX
+    fcntl = None
+
+try:  # optional: incremental JSON parsing straight off ffprobe's stdout
+    import ijson
+except ImportError:
+    ijson = None
+
+try:  # optional: in-process probing via libav bindings (PyAV)
+    import av
+except ImportError:
+    av = None
 
 from hexmedia.common.logging import get_logger
+from hexmedia.common.settings import get_settings
 logger = get_logger()
 
 def build_ffprobe_cmd(input_path: str | Path, extra_args: Iterable[str] | None = None) -> List[str]:
@@ -29,15 +51,36 @@ def build_ffprobe_cmd(input_path: str | Path, extra_args: Iterable[str] | None =
         base = base[:-1] + list(extra_args) + base[-1:]
     return base
 
+_PIPE_SZ = 1 << 20
+
+
+def _grow_pipe(f) -> None:
+    """Best effort: enlarge a pipe buffer (Linux F_SETPIPE_SZ) so the child rarely blocks on a full pipe."""
+    if fcntl is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(f.fileno(), fcntl.F_SETPIPE_SZ, _PIPE_SZ)
+    except OSError:
+        pass  # capped by /proc/sys/fs/pipe-max-size for unprivileged processes
+
+
 def run_ffprobe(cmd: List[str]) -> Dict[str, Any]:
     """
     Execute ffprobe and return parsed JSON. Raises CalledProcessError on failure.
     """
-    logger.debug("ffprobe cmd: %s", " ".join(shlex.quote(p) for p in cmd))
-    cp = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    if logger.isEnabledFor(logging.DEBUG):  # skip the quote/join entirely when debug is off
+        logger.debug("ffprobe cmd: %s", " ".join(shlex.quote(p) for p in cmd))
+    # communicate() drains stdout and stderr together, so neither pipe can fill and
+    # stall the child; keep stdout as bytes since orjson parses bytes directly.
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as proc:
+        _grow_pipe(proc.stdout)
+        out, err = proc.communicate()
+        rc = proc.returncode
+    if rc:
+        raise subprocess.CalledProcessError(rc, cmd, output=out, stderr=err)
     try:
-        data = json.loads(cp.stdout or "{}")
-    except json.JSONDecodeError as e:
+        data = orjson.loads(out or b"{}")
+    except orjson.JSONDecodeError as e:
         logger.exception("Failed to parse ffprobe JSON")
         raise RuntimeError("ffprobe produced invalid JSON") from e
     return data
@@ -50,9 +93,21 @@ def parse_ffprobe(data: Dict[str, Any]) -> Dict[str, Any]:
     fmt = (data or {}).get("format", {}) or {}
     streams = (data or {}).get("streams", []) or []
 
-    v_stream = next((s for s in streams if s.get("codec_type") == "video"), None)
-    a_stream = next((s for s in streams if s.get("codec_type") == "audio"), None)
-    s_streams = [s for s in streams if s.get("codec_type") == "subtitle"]
+    # One pass over streams: first video, first audio, and whether any subtitle exists
+    v_stream = a_stream = None
+    has_subs = False
+    for s in streams:
+        t = s.get("codec_type")
+        if t == "video":
+            if v_stream is None:
+                v_stream = s
+        elif t == "audio":
+            if a_stream is None:
+                a_stream = s
+        elif t == "subtitle":
+            has_subs = True
+        if v_stream is not None and a_stream is not None and has_subs:
+            break
 
     def _maybe_int(x):
         try: return int(float(x))
@@ -78,7 +133,7 @@ def parse_ffprobe(data: Dict[str, Any]) -> Dict[str, Any]:
         "container": fmt.get("format_name"),
         "bitrate": _maybe_int(fmt.get("bit_rate")),
         "language": (v_stream or {}).get("tags", {}).get("language") or fmt.get("tags", {}).get("language"),
-        "has_subtitles": bool(s_streams),
+        "has_subtitles": has_subs,
         "codec_video": (v_stream or {}).get("codec_name"),
         "codec_audio": (a_stream or {}).get("codec_name"),
         "width": _maybe_int((v_stream or {}).get("width")),
@@ -87,3 +142,223 @@ def parse_ffprobe(data: Dict[str, Any]) -> Dict[str, Any]:
         "aspect_ratio": (v_stream or {}).get("display_aspect_ratio") or (v_stream or {}).get("sample_aspect_ratio"),
     }
     return parsed
+
+
+# The only ffprobe keys parse_ffprobe() reads; everything else is skipped while streaming
+_FORMAT_KEYS = frozenset({"duration", "format_name", "bit_rate"})
+_STREAM_KEYS = frozenset({
+    "codec_type", "codec_name", "width", "height",
+    "r_frame_rate", "display_aspect_ratio", "sample_aspect_ratio",
+})
+_SCALAR_EVENTS = frozenset({"string", "number", "boolean", "null"})
+
+
+def _reduce_ffprobe_events(events) -> Dict[str, Any]:
+    """
+    Fold ijson (prefix, event, value) events into a minimal ffprobe-shaped dict: just
+    the format fields and the first video/audio/subtitle stream, each trimmed to the
+    keys parse_ffprobe() uses. Memory stays flat however many streams/chapters there are.
+    """
+    fmt: Dict[str, Any] = {}
+    streams: List[Dict[str, Any]] = []
+    seen_types: set = set()
+    cur: Dict[str, Any] | None = None
+
+    for prefix, event, value in events:
+        if prefix == "streams.item":
+            if event == "start_map":
+                cur = {}
+            elif event == "end_map" and cur is not None:
+                t = cur.get("codec_type")
+                if t in ("video", "audio", "subtitle") and t not in seen_types:
+                    seen_types.add(t)
+                    streams.append(cur)
+                cur = None
+        elif event not in _SCALAR_EVENTS:
+            continue
+        elif cur is not None and prefix.startswith("streams.item."):
+            key = prefix[13:]
+            if key in _STREAM_KEYS:
+                cur[key] = value
+            elif key == "tags.language":
+                cur["tags"] = {"language": value}
+        elif prefix.startswith("format."):
+            key = prefix[7:]
+            if key in _FORMAT_KEYS:
+                fmt[key] = value
+            elif key == "tags.language":
+                fmt["tags"] = {"language": value}
+
+    return {"format": fmt, "streams": streams}
+
+
+def run_ffprobe_parsed(cmd: List[str]) -> Dict[str, Any]:
+    """
+    run_ffprobe() + parse_ffprobe() in one step. With ijson installed the JSON is
+    parsed incrementally as ffprobe writes it, keeping only the fields we extract;
+    without it this is exactly parse_ffprobe(run_ffprobe(cmd)).
+    """
+    if ijson is None:
+        return parse_ffprobe(run_ffprobe(cmd))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("ffprobe cmd: %s", " ".join(shlex.quote(p) for p in cmd))
+    # stdout is consumed incrementally below, so stderr goes to a temp file rather than
+    # a second pipe that nobody reads until the end (and that could fill and stall the child)
+    with tempfile.TemporaryFile() as err_f:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err_f) as proc:
+            _grow_pipe(proc.stdout)
+            try:
+                data = _reduce_ffprobe_events(ijson.parse(proc.stdout)) if proc.stdout.peek(1) else {}
+            except ijson.JSONError as e:
+                proc.kill()
+                logger.exception("Failed to parse ffprobe JSON")
+                raise RuntimeError("ffprobe produced invalid JSON") from e
+            rc = proc.wait()
+        if rc:
+            err_f.seek(0)
+            raise subprocess.CalledProcessError(rc, cmd, stderr=err_f.read())
+    return parse_ffprobe(data)
+
+
+def libav_available() -> bool:
+    """True when PyAV is importable and probe_via_libav() can be used."""
+    return av is not None
+
+
+def probe_via_libav(input_path: str | Path) -> Dict[str, Any]:
+    """
+    In-process equivalent of run_ffprobe() + parse_ffprobe() using PyAV, so no
+    ffprobe process is spawned and no JSON is produced/parsed. Returns the same
+    keys as parse_ffprobe(). Raises if PyAV is missing or can't open the file;
+    callers fall back to the ffprobe subprocess path.
+    """
+    if av is None:
+        raise RuntimeError("PyAV is not installed")
+
+    with av.open(str(input_path), metadata_errors="ignore") as container:
+        v_stream = a_stream = None
+        has_subs = False
+        for s in container.streams:
+            if s.type == "video" and v_stream is None:
+                v_stream = s
+            elif s.type == "audio" and a_stream is None:
+                a_stream = s
+            elif s.type == "subtitle":
+                has_subs = True
+
+        v_ctx = v_stream.codec_context if v_stream is not None else None
+        a_ctx = a_stream.codec_context if a_stream is not None else None
+
+        # ffprobe reports r_frame_rate; PyAV exposes it as base_rate
+        rate = None
+        if v_stream is not None:
+            rate = getattr(v_stream, "base_rate", None) or v_stream.average_rate
+
+        aspect = None
+        if v_ctx is not None:
+            ar = getattr(v_ctx, "display_aspect_ratio", None) or getattr(v_ctx, "sample_aspect_ratio", None)
+            if ar:
+                aspect = f"{ar.numerator}:{ar.denominator}"
+
+        v_meta = dict(v_stream.metadata) if v_stream is not None else {}
+        c_meta = dict(container.metadata or {})
+
+        return {
+            "duration_sec": int(container.duration / av.time_base) if container.duration is not None else None,
+            "container": container.format.name,
+            "bitrate": int(container.bit_rate) if container.bit_rate else None,
+            "language": v_meta.get("language") or c_meta.get("language"),
+            "has_subtitles": has_subs,
+            "codec_video": v_ctx.name if v_ctx is not None else None,
+            "codec_audio": a_ctx.name if a_ctx is not None else None,
+            "width": int(v_ctx.width) if v_ctx is not None and v_ctx.width else None,
+            "height": int(v_ctx.height) if v_ctx is not None and v_ctx.height else None,
+            "fps": float(rate) if rate else None,
+            "aspect_ratio": aspect,
+        }
+
+
+def probe_file(input_path: str | Path) -> Dict[str, Any]:
+    """
+    Probe one file and return parse_ffprobe()-shaped fields: in-process through
+    libav when available, otherwise (or if libav can't open it) via ffprobe.
+    """
+    if av is not None:
+        try:
+            return probe_via_libav(input_path)
+        except Exception as e:
+            logger.debug("libav probe failed for %s, falling back to ffprobe: %s", input_path, e)
+    return run_ffprobe_parsed(build_ffprobe_cmd(input_path))
+
+
+class ProbeCache:
+    """
+    sqlite-backed map of (path, mtime_ns, size) -> parsed probe fields.
+    A changed file gets a new key, so stale entries are simply never hit again;
+    they age out once more than max_entries rows exist (oldest inserts first).
+    Defaults to an in-memory database; pass a file path to persist across runs.
+    Safe to share between threads.
+    """
+
+    def __init__(self, db_path: str | Path = ":memory:", max_entries: int | None = 10_000) -> None:
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS probe ("
+                " path TEXT NOT NULL, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL,"
+                " data BLOB NOT NULL, PRIMARY KEY (path, mtime_ns, size))"
+            )
+
+    def get(self, key: Tuple[str, int, int]) -> Dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM probe WHERE path = ? AND mtime_ns = ? AND size = ?", key
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def put(self, key: Tuple[str, int, int], data: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "INSERT OR REPLACE INTO probe (path, mtime_ns, size, data) VALUES (?, ?, ?, ?)",
+                (*key, orjson.dumps(data)),
+            )
+            if self._max_entries is not None:
+                # rowids grow with each insert (REPLACE re-inserts), so this range delete
+                # drops everything but the newest max_entries rows
+                self._conn.execute(
+                    "DELETE FROM probe WHERE rowid <= ?", (cur.lastrowid - self._max_entries,)
+                )
+
+
+_default_cache: ProbeCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def _get_default_cache() -> ProbeCache:
+    # Built on first use from settings (ffprobe.cache_path / ffprobe.cache_max_entries)
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                cfg = get_settings().ffprobe
+                _default_cache = ProbeCache(cfg.cache_path or ":memory:", max_entries=cfg.cache_max_entries)
+    return _default_cache
+
+
+def probe_cached(input_path: str | Path, cache: ProbeCache | None = None) -> Dict[str, Any]:
+    """
+    probe_file() behind a (path, mtime, size) cache: one stat per call, and the
+    probe itself only runs for new or changed files.
+    """
+    cache = cache or _get_default_cache()
+    st = os.stat(input_path)
+    key = (str(input_path), st.st_mtime_ns, st.st_size)
+    hit = cache.get(key)
+    if hit is not None:
+        return hit
+    data = probe_file(input_path)
+    cache.put(key, data)
+    return data
@@ -11,13 +11,16 @@ from hexmedia.common.strings.splitters import csv_to_list
 
 
 
+_BOOL_TRUE = frozenset({"1", "true", "yes", "y", "on"})
+
+
 def _to_bool(v: str | bool | int | None, default: bool = False) -> bool:
     if isinstance(v, bool):
         return v
     if v is None:
         return default
     s = str(v).strip().lower()
-    return s in {"1", "true", "yes", "y", "on"}
+    return s in _BOOL_TRUE
 
 
 class APIConfig(BaseModel):
@@ -47,8 +50,11 @@ class DBConfig(BaseModel):
     echo: bool = False
     pool_size: int = 10
     max_overflow: int = 20
-    pool_pre_ping: bool = True
-    pool_recycle: int = 1800
+    # Timed recycling (kept below the server/LB idle timeout) instead of a SELECT 1 per
+    # checkout; turn pre-ping back on behind proxies that silently drop idle connections.
+    pool_pre_ping: bool = False
+    pool_recycle: int = 300
+    query_cache_size: int = 1200  # compiled-statement LRU per engine (SQLAlchemy default: 500)
 
     # Optional single URL (if set, it takes precedence)
     url: Optional[str] = Field(
@@ -81,6 +87,10 @@ class FFProbeConfig(BaseModel):
     timeout_sec: int = 30
     log_level: str = "error"  # quiet|panic|fatal|error|warning|info|verbose|debug|trace
     bin: str = Field(default="/usr/bin/ffprobe", alias="FFPROBE_BIN")
+    # probe_cached(): sqlite file to persist results across runs (None = in-memory),
+    # and a cap on cached files, oldest entries evicted first
+    cache_path: Optional[Path] = Field(default=None, alias="FFPROBE_CACHE_PATH")
+    cache_max_entries: int = Field(default=10_000, ge=1, alias="FFPROBE_CACHE_MAX_ENTRIES")
 
 
 class FeatureFlags(BaseModel):
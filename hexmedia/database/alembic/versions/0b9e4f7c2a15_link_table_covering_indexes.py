@@ -0,0 +1,52 @@
+"""covering indexes on link tables
+
+Revision ID: 0b9e4f7c2a15
+Revises: f6a3d8e2b519
+Create Date: 2026-10-15 11:48:05.271903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b9e4f7c2a15'
+down_revision: Union[str, Sequence[str], None] = 'f6a3d8e2b519'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, old single-column index, new covering index, columns)
+_INDEXES = (
+    ('media_tag', 'ix_media_tag_tag_id', 'ix_media_tag_tag_id_mid', ['tag_id', 'media_item_id']),
+    ('media_person', 'ix_media_person_person_id', 'ix_media_person_person_id_mid',
+     ['person_id', 'media_item_id']),
+    ('person_alias_link', 'ix_person_alias_link_alias_id', 'ix_person_alias_link_alias_id_pid',
+     ['alias_id', 'person_id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Reverse-direction lookups (tag -> items, person -> items, alias -> people) filter on
+    # the first column and only need the second: with both in the index Postgres answers
+    # them with an index-only scan. Build the new index before dropping the old one.
+    with op.get_context().autocommit_block():
+        for table, old, new, cols in _INDEXES:
+            op.create_index(new, table, cols, unique=False, schema='hexmedia',
+                            postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(old, table_name=table, schema='hexmedia',
+                          postgresql_concurrently=True, if_exists=True)
+        # index-only scans need an up-to-date visibility map
+        for table, *_ in _INDEXES:
+            op.execute(f"VACUUM ANALYZE hexmedia.{table}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, old, new, cols in _INDEXES:
+            op.create_index(old, table, cols[:1], unique=False, schema='hexmedia',
+                            postgresql_concurrently=True, if_not_exists=True)
+            op.drop_index(new, table_name=table, schema='hexmedia',
+                          postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,36 @@
+"""person_alias trigram index on alias_normalized
+
+Revision ID: 2c6a9d4e8f15
+Revises: 8e1f5a3c7b92
+Create Date: 2026-10-15 08:53:06.471829
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6a9d4e8f15'
+down_revision: Union[str, Sequence[str], None] = '8e1f5a3c7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fuzzy alias lookups (`alias_normalized % :q` / ILIKE '%q%'); the unique btree
+    # (uq_person_alias_normalized_global) still handles exact-match dedup on insert.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_person_alias_normalized_trgm', 'person_alias', ['alias_normalized'],
+                        unique=False, schema='hexmedia',
+                        postgresql_ops={'alias_normalized': 'gin_trgm_ops'},
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_person_alias_normalized_trgm', table_name='person_alias', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,59 @@
+"""media_item.bucket generated column
+
+Revision ID: 3e7a9b2c4d61
+Revises: 9c3d5e1f7a48
+Create Date: 2026-10-15 13:41:52.218406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e7a9b2c4d61'
+down_revision: Union[str, Sequence[str], None] = '9c3d5e1f7a48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_bucket_counts_view(bucket_expr: str) -> None:
+    # keep in sync with hexmedia.database.models.media (media_bucket_counts DDL)
+    op.execute(f"""
+        CREATE MATERIALIZED VIEW hexmedia.mv_media_bucket_counts AS
+        SELECT {bucket_expr} AS bucket, count(*) AS n
+        FROM hexmedia.media_item
+        WHERE media_folder IS NOT NULL
+        GROUP BY 1;
+    """)
+    op.execute("CREATE UNIQUE INDEX ix_mv_media_bucket_counts_bucket "
+               "ON hexmedia.mv_media_bucket_counts (bucket);")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # split_part() runs once per row at write time instead of on every aggregation
+    # (adding a stored generated column rewrites the table)
+    op.add_column('media_item', sa.Column(
+        'bucket', sa.Text(),
+        sa.Computed("split_part(media_folder, '/', 1)", persisted=True), nullable=True,
+    ), schema='hexmedia')
+    with op.get_context().autocommit_block():
+        op.create_index('ix_media_item_bucket', 'media_item', ['bucket'], unique=False,
+                        schema='hexmedia', postgresql_concurrently=True, if_not_exists=True)
+
+    # Rebuild the view on the indexed column: its refresh becomes an index-only scan
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS hexmedia.mv_media_bucket_counts;")
+    _create_bucket_counts_view('bucket')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS hexmedia.mv_media_bucket_counts;")
+    _create_bucket_counts_view("split_part(media_folder, '/', 1)")
+
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_media_item_bucket', table_name='media_item', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+    op.drop_column('media_item', 'bucket', schema='hexmedia')
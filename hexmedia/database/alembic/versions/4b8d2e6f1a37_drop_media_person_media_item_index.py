@@ -0,0 +1,34 @@
+"""drop media_person media_item_id index
+
+Revision ID: 4b8d2e6f1a37
+Revises: dd8cb07920f8
+Create Date: 2026-10-15 08:41:17.250634
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b8d2e6f1a37'
+down_revision: Union[str, Sequence[str], None] = 'dd8cb07920f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The (media_item_id, person_id) pair index leads with media_item_id, so it serves
+    # media_item_id-only filters; this single-column btree only adds write cost.
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_media_person_media_item_id', table_name='media_person', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_media_person_media_item_id', 'media_person', ['media_item_id'],
+                        unique=False, schema='hexmedia',
+                        postgresql_concurrently=True, if_not_exists=True)
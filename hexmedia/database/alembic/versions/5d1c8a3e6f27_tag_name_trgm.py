@@ -0,0 +1,35 @@
+"""trigram index on tag.name
+
+Revision ID: 5d1c8a3e6f27
+Revises: 0b9e4f7c2a15
+Create Date: 2026-10-15 12:20:49.336817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1c8a3e6f27'
+down_revision: Union[str, Sequence[str], None] = '0b9e4f7c2a15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Tag search is `name ILIKE '%q%'`; ix_tag_name_lower only serves equality/prefix.
+    # pg_trgm is enabled by dd8cb07920f8.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_tag_name_trgm', 'tag', ['name'], unique=False, schema='hexmedia',
+                        postgresql_ops={'name': 'gin_trgm_ops'},
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tag_name_trgm', table_name='tag', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,35 @@
+"""drop media_item identity prefix index
+
+Revision ID: 7f2d4a6c8e13
+Revises: 3e7a9b2c4d61
+Create Date: 2026-10-15 14:18:05.771392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f2d4a6c8e13'
+down_revision: Union[str, Sequence[str], None] = '3e7a9b2c4d61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uq_mediaitem_folder_identity_ext's unique index on (media_folder, identity_name,
+    # video_ext) serves full-triplet lookups and any (media_folder, identity_name) prefix
+    # probe; this two-column index only adds write and vacuum cost.
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_mediaitem_folder_identity', table_name='media_item', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_mediaitem_folder_identity', 'media_item',
+                        ['media_folder', 'identity_name'], unique=False, schema='hexmedia',
+                        postgresql_concurrently=True, if_not_exists=True)
@@ -0,0 +1,48 @@
+"""people trigram index on normalized_name
+
+Revision ID: 8e1f5a3c7b92
+Revises: 4b8d2e6f1a37
+Create Date: 2026-10-15 08:47:52.093318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1f5a3c7b92'
+down_revision: Union[str, Sequence[str], None] = '4b8d2e6f1a37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Name search matches against normalized_name, so that is the trigram target; the
+    # GIN index also serves equality (via recheck), so the separate btree goes too.
+    with op.get_context().autocommit_block():
+        op.create_index('ix_people_normalized_name_trgm', 'people', ['normalized_name'],
+                        unique=False, schema='hexmedia',
+                        postgresql_ops={'normalized_name': 'gin_trgm_ops'},
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_people_display_name_trgm', table_name='people', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_people_normalized_name', table_name='people', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index('ix_people_normalized_name', 'people', ['normalized_name'],
+                        unique=False, schema='hexmedia',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_people_display_name_trgm', 'people', ['display_name'],
+                        unique=False, schema='hexmedia',
+                        postgresql_ops={'display_name': 'gin_trgm_ops'},
+                        postgresql_using='gin',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.drop_index('ix_people_normalized_name_trgm', table_name='people', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
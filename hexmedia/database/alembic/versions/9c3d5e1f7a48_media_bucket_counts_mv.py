@@ -0,0 +1,37 @@
+"""media bucket counts materialized view
+
+Revision ID: 9c3d5e1f7a48
+Revises: 5d1c8a3e6f27
+Create Date: 2026-10-15 13:02:11.604937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3d5e1f7a48'
+down_revision: Union[str, Sequence[str], None] = '5d1c8a3e6f27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keep in sync with hexmedia.database.models.media (media_bucket_counts DDL)
+    op.execute("""
+        CREATE MATERIALIZED VIEW hexmedia.mv_media_bucket_counts AS
+        SELECT split_part(media_folder, '/', 1) AS bucket, count(*) AS n
+        FROM hexmedia.media_item
+        WHERE media_folder IS NOT NULL
+        GROUP BY 1;
+    """)
+    # REFRESH ... CONCURRENTLY requires a unique index on the view
+    op.execute("CREATE UNIQUE INDEX ix_mv_media_bucket_counts_bucket "
+               "ON hexmedia.mv_media_bucket_counts (bucket);")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS hexmedia.mv_media_bucket_counts;")
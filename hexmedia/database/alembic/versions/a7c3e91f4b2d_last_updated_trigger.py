@@ -0,0 +1,47 @@
+"""last_updated trigger
+
+Revision ID: a7c3e91f4b2d
+Revises: 2c6a9d4e8f15
+Create Date: 2026-10-15 09:12:44.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e91f4b2d'
+down_revision: Union[str, Sequence[str], None] = '2c6a9d4e8f15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# ServiceObject-mapped tables (everything carrying last_updated)
+_TABLES = ('media_item', 'media_asset', 'people', 'person_alias', 'tag', 'tag_group')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # One generic function; each table gets a BEFORE UPDATE row trigger calling it, so
+    # clients no longer send `last_updated = clock_timestamp()` in every SET list.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION hexmedia.set_last_updated() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            NEW.last_updated := clock_timestamp();
+            RETURN NEW;
+        END;
+        $$;
+    """)
+    for t in _TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{t}_last_updated BEFORE UPDATE ON hexmedia.{t} "
+            f"FOR EACH ROW EXECUTE FUNCTION hexmedia.set_last_updated();"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for t in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{t}_last_updated ON hexmedia.{t};")
+    op.execute("DROP FUNCTION IF EXISTS hexmedia.set_last_updated();")
@@ -0,0 +1,28 @@
+"""people.normalized_name NOT NULL
+
+Revision ID: b5e1c7d9f032
+Revises: 7f2d4a6c8e13
+Create Date: 2026-10-15 14:36:40.129557
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1c7d9f032'
+down_revision: Union[str, Sequence[str], None] = '7f2d4a6c8e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Generated from display_name (NOT NULL) since c4e8b1d7a903, so it can never be NULL
+    op.alter_column('people', 'normalized_name', nullable=False, schema='hexmedia')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column('people', 'normalized_name', nullable=True, schema='hexmedia')
@@ -0,0 +1,87 @@
+"""generated normalized names
+
+Revision ID: c4e8b1d7a903
+Revises: a7c3e91f4b2d
+Create Date: 2026-10-15 10:03:27.904116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8b1d7a903'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e91f4b2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _normalized_sql(col: str) -> str:
+    # keep in sync with hexmedia.database.models.person._normalized_sql
+    return rf"lower(btrim(regexp_replace({col}, '\s+', ' ', 'g')))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A plain column can't be turned into a generated one in place: drop and re-add
+    # (Postgres computes the stored value for existing rows), then rebuild the indexes.
+    # Tolerant drops: a database may carry either the current index names or the ones
+    # dd8cb07920f8 originally created; both end at the same set of indexes.
+    for ix in ('ix_people_normalized_name_trgm', 'ix_people_display_name_trgm', 'ix_people_normalized_name'):
+        op.drop_index(ix, table_name='people', schema='hexmedia', if_exists=True)
+    op.drop_column('people', 'normalized_name', schema='hexmedia')
+    op.add_column('people', sa.Column(
+        'normalized_name', sa.String(length=255),
+        sa.Computed(_normalized_sql('display_name'), persisted=True), nullable=True,
+    ), schema='hexmedia')
+    op.create_index('ix_people_normalized_name_trgm', 'people', ['normalized_name'],
+                    unique=False, schema='hexmedia',
+                    postgresql_ops={'normalized_name': 'gin_trgm_ops'},
+                    postgresql_using='gin')
+
+    op.drop_index('ix_person_alias_normalized_trgm', table_name='person_alias', schema='hexmedia',
+                  if_exists=True)
+    op.drop_constraint('uq_person_alias_normalized_global', 'person_alias',
+                       schema='hexmedia', type_='unique')
+    op.drop_column('person_alias', 'alias_normalized', schema='hexmedia')
+    op.add_column('person_alias', sa.Column(
+        'alias_normalized', sa.String(length=255),
+        sa.Computed(_normalized_sql('alias'), persisted=True), nullable=False,
+    ), schema='hexmedia')
+    op.create_unique_constraint('uq_person_alias_normalized_global', 'person_alias',
+                                ['alias_normalized'], schema='hexmedia')
+    op.create_index('ix_person_alias_normalized_trgm', 'person_alias', ['alias_normalized'],
+                    unique=False, schema='hexmedia',
+                    postgresql_ops={'alias_normalized': 'gin_trgm_ops'},
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Back to plain columns, keeping the current values
+    op.drop_index('ix_person_alias_normalized_trgm', table_name='person_alias', schema='hexmedia')
+    op.drop_constraint('uq_person_alias_normalized_global', 'person_alias',
+                       schema='hexmedia', type_='unique')
+    op.drop_column('person_alias', 'alias_normalized', schema='hexmedia')
+    op.add_column('person_alias', sa.Column('alias_normalized', sa.String(length=255), nullable=True),
+                  schema='hexmedia')
+    op.execute(f"UPDATE hexmedia.person_alias SET alias_normalized = {_normalized_sql('alias')};")
+    op.alter_column('person_alias', 'alias_normalized', nullable=False, schema='hexmedia')
+    op.create_unique_constraint('uq_person_alias_normalized_global', 'person_alias',
+                                ['alias_normalized'], schema='hexmedia')
+    op.create_index('ix_person_alias_normalized_trgm', 'person_alias', ['alias_normalized'],
+                    unique=False, schema='hexmedia',
+                    postgresql_ops={'alias_normalized': 'gin_trgm_ops'},
+                    postgresql_using='gin')
+
+    op.drop_index('ix_people_normalized_name_trgm', table_name='people', schema='hexmedia')
+    op.drop_column('people', 'normalized_name', schema='hexmedia')
+    op.add_column('people', sa.Column('normalized_name', sa.String(length=255), nullable=True),
+                  schema='hexmedia')
+    op.execute(f"UPDATE hexmedia.people SET normalized_name = {_normalized_sql('display_name')};")
+    op.create_index('ix_people_normalized_name_trgm', 'people', ['normalized_name'],
+                    unique=False, schema='hexmedia',
+                    postgresql_ops={'normalized_name': 'gin_trgm_ops'},
+                    postgresql_using='gin')
@@ -0,0 +1,36 @@
+"""media_item newest-video partial index
+
+Revision ID: c8e4f1a2b6d5
+Revises: b5e1c7d9f032
+Create Date: 2026-10-15 15:06:42.318570
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8e4f1a2b6d5'
+down_revision: Union[str, Sequence[str], None] = 'b5e1c7d9f032'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # find_video_candidates_for_thumbs: WHERE kind = 'video' ORDER BY date_created DESC
+    # NULLS LAST LIMIT n becomes a top-N walk of this index instead of scan + sort
+    with op.get_context().autocommit_block():
+        op.create_index('ix_media_item_video_recent', 'media_item',
+                        [sa.text('date_created DESC NULLS LAST')], unique=False, schema='hexmedia',
+                        postgresql_where=sa.text("kind = 'video'"),
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_media_item_video_recent', table_name='media_item', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,37 @@
+"""drop link-table unique constraints duplicating the PK
+
+Revision ID: e2b7c5a91d04
+Revises: c4e8b1d7a903
+Create Date: 2026-10-15 10:41:52.117349
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c5a91d04'
+down_revision: Union[str, Sequence[str], None] = 'c4e8b1d7a903'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Both link tables already use the natural pair as PRIMARY KEY, which enforces the
+    # same uniqueness with the same (leftmost) index; the extra constraints only cost
+    # a second index per row.
+    # IF EXISTS: databases built from dd8cb07920f8 can lack the person_alias_link one
+    # (drop_constraint's if_exists needs alembic 1.16; we support 1.13+)
+    op.execute("ALTER TABLE hexmedia.media_person DROP CONSTRAINT IF EXISTS uq_media_person_pair;")
+    op.execute("ALTER TABLE hexmedia.person_alias_link "
+               "DROP CONSTRAINT IF EXISTS uq_person_alias_link_person_alias;")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint('uq_person_alias_link_person_alias', 'person_alias_link',
+                                ['person_id', 'alias_id'], schema='hexmedia')
+    op.create_unique_constraint('uq_media_person_pair', 'media_person',
+                                ['media_item_id', 'person_id'], schema='hexmedia')
@@ -0,0 +1,44 @@
+"""trim tag indexes
+
+Revision ID: f6a3d8e2b519
+Revises: e2b7c5a91d04
+Create Date: 2026-10-15 11:07:38.660512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a3d8e2b519'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c5a91d04'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # - ix_tag_group_id duplicates the leftmost column of uq_tag_group_slug (group_id, slug)
+    # - ix_tag_parent_id becomes partial: root tags (parent_id IS NULL) are never looked
+    #   up through it, so they no longer cost an index entry
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tag_group_id', table_name='tag', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_tag_parent_id', table_name='tag', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+        op.create_index('ix_tag_parent_id', 'tag', ['parent_id'], unique=False, schema='hexmedia',
+                        postgresql_where=sa.text('parent_id IS NOT NULL'),
+                        postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tag_parent_id', table_name='tag', schema='hexmedia',
+                      postgresql_concurrently=True, if_exists=True)
+        op.create_index('ix_tag_parent_id', 'tag', ['parent_id'], unique=False, schema='hexmedia',
+                        postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_tag_group_id', 'tag', ['group_id'], unique=False, schema='hexmedia',
+                        postgresql_concurrently=True, if_not_exists=True)
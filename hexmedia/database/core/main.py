@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Generator, Iterator, List
 
-from sqlalchemy import MetaData, create_engine, event, Column, Table
+from sqlalchemy import MetaData, create_engine, Column, Table
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from hexmedia.common.settings import get_settings
@@ -19,6 +19,7 @@ NAMING_CONVENTION = {
 }
 
 _serviceobject_first = ("id", "date_created", "last_updated", "data_origin", "meta_data")
+_PRIORITY = {n: i for i, n in enumerate(_serviceobject_first)}
 
 class Base(DeclarativeBase):
     # Set a default schema to keep DDL/Autogenerate explicit and consistent
@@ -40,16 +41,28 @@ class Base(DeclarativeBase):
         cols: List[Column] = [x for x in rest if isinstance(x, Column)]
         others = [x for x in rest if not isinstance(x, Column)]
 
-        # Stable ordering: ServiceObject fields first, then everything else in their original order
-        priority = {n: i for i, n in enumerate(_serviceobject_first)}
-        # Remember original index to preserve relative order among same-priority items
-        original_index = {c: i for i, c in enumerate(cols)}
-
-        cols.sort(key=lambda c: (priority.get(c.name, 10_000), original_index[c]))
+        # ServiceObject fields first (in their fixed order), then everything else in
+        # original order: a single bucketing pass, no sort
+        head: List[Column | None] = [None] * len(_serviceobject_first)
+        tail: List[Column] = []
+        for c in cols:
+            p = _PRIORITY.get(c.name)
+            if p is None:
+                tail.append(c)
+            else:
+                head[p] = c
+        cols = [c for c in head if c is not None] + tail
 
         # Rebuild table with reordered columns
         return Table(name, metadata, *(cols + others), **kw)
 
+# Ensure the app schema is first, then public (so extensions remain visible).
+# Sent as a libpq startup option: the server applies it while opening the session,
+# so new pooled connections need no extra SET round-trip or Python connect hook.
+_connect_args: dict = {}
+if _settings.db_schema and _settings.db_schema.lower() != "public":
+    _connect_args["options"] = f'-csearch_path="{_settings.db_schema}",public'
+
 engine = create_engine(
     _settings.database_url,                 # <- consistent with env.py
     echo=_settings.db.echo,
@@ -57,31 +70,43 @@ engine = create_engine(
     max_overflow=_settings.db.max_overflow,
     pool_pre_ping=_settings.db.pool_pre_ping,
     pool_recycle=_settings.db.pool_recycle,
+    query_cache_size=_settings.db.query_cache_size,
+    connect_args=_connect_args,
     future=True,
 )
 
-# Ensure the app schema is first, then public (so extensions remain visible)
-if _settings.db_schema and _settings.db_schema.lower() != "public":
-    @event.listens_for(engine, "connect")
-    def _set_search_path(dbapi_conn, _):
-        with dbapi_conn.cursor() as cur:
-            cur.execute(f'SET search_path TO "{_settings.db_schema}", public')
-
 
 SessionLocal = sessionmaker(bind=engine, expire_on_commit=False, future=True, autoflush=False)
 
+# Read-only sessions run each statement in autocommit mode: no implicit BEGIN, so no
+# COMMIT round-trip at the end of a pure-read request. Never use these for writes.
+SessionLocalRO = sessionmaker(
+    bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+    expire_on_commit=False,
+    future=True,
+    autoflush=False,
+)
+
 
 def get_session() -> Iterator[Session]:
     """
     FastAPI-friendly dependency that yields a transaction-scoped Session.
-    Commits on success, rolls back on error.
+    Commits on success, rolls back on error (via Session.begin()).
     """
     session: Session = SessionLocal()
+    try:
+        with session.begin():
+            yield session
+    finally:
+        session.close()
+
+
+def get_session_ro() -> Iterator[Session]:
+    """
+    Read-only counterpart of get_session(): autocommit Session, never committed.
+    """
+    session: Session = SessionLocalRO()
     try:
         yield session
-        session.commit()
-    except Exception:
-        session.rollback()
-        raise
     finally:
         session.close()
@@ -5,47 +5,44 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID as PyUUID
 
-from sqlalchemy import DateTime, Text, func, text
+from sqlalchemy import DateTime, FetchedValue, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column, declared_attr
+from sqlalchemy.orm import Mapped, mapped_column
 
+from hexmedia.common.ids import uuid7
+from hexmedia.database.core.main import Base
 
-class ServiceObject:
+
+class ServiceObject(Base):
     """
-    Mixin providing common columns for persisted models.
-    Use with multiple inheritance: `class MyModel(ServiceObject, Base): ...`
+    Abstract base providing common columns for persisted models.
+    Subclass it directly: `class MyModel(ServiceObject): ...`
+
+    Plain mapped_column() attributes (no @declared_attr): declarative copies the
+    Column objects into each subclass instead of invoking a descriptor per class.
     """
     __abstract__ = True
 
-    @declared_attr
-    def id(cls) -> Mapped[PyUUID]:
-        # requires `uuid-ossp` extension; we enable it in migrations
-        return mapped_column(
-            UUID(as_uuid=True),
-            primary_key=True,
-            server_default=text("gen_random_uuid()"),
-        )
-
-    @declared_attr
-    def date_created(cls) -> Mapped[Optional[datetime]]:
-        return mapped_column(
-            DateTime(timezone=True),
-            server_default=func.clock_timestamp(),
-        )
-
-    @declared_attr
-    def last_updated(cls) -> Mapped[Optional[datetime]]:
-        return mapped_column(
-            DateTime(timezone=True),
-            server_default=func.clock_timestamp(),
-            onupdate=func.clock_timestamp(),
-        )
-
-    @declared_attr
-    def data_origin(cls) -> Mapped[Optional[str]]:
-        return mapped_column(Text, nullable=True)
-
-    @declared_attr
-    def meta_data(cls) -> Mapped[Optional[dict]]:
-        # Use JSONB for Postgres; switch to JSON if targeting multiple DBs
-        return mapped_column(JSONB, nullable=True)
+    # Client-side time-ordered UUIDv7: inserts land on the rightmost PK leaf pages and
+    # the id is known before INSERT. The gen_random_uuid() server default (pgcrypto or
+    # PG13+ core) only remains as a fallback for rows inserted outside SQLAlchemy.
+    id: Mapped[PyUUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid7,
+        server_default=text("gen_random_uuid()"),
+    )
+    date_created: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.clock_timestamp(),
+    )
+    # Bumped server-side by a BEFORE UPDATE trigger (migration a7c3e91f4b2d); FetchedValue
+    # keeps it out of UPDATE SET lists and tells the ORM to refresh it afterwards.
+    last_updated: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.clock_timestamp(),
+        server_onupdate=FetchedValue(),
+    )
+    data_origin: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Use JSONB for Postgres; switch to JSON if targeting multiple DBs
+    meta_data: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
@@ -1,4 +1,5 @@
 # hexmedia/database/models/__init__.py
+from sqlalchemy import DDL, event
 
 from hexmedia.database.models.media import (
     Base,
@@ -31,3 +32,27 @@ __all__ = [
     "PersonAliasLink",
     "MediaPerson",
 ]
+
+# Mirror migration a7c3e91f4b2d for metadata.create_all() (tests build the schema without
+# Alembic): last_updated is bumped by a BEFORE UPDATE trigger, and cached domain mappings
+# are keyed on it.
+_SCHEMA_PREFIX = f"{Base.metadata.schema}." if Base.metadata.schema else ""
+event.listen(Base.metadata, "before_create", DDL(f"""
+    CREATE OR REPLACE FUNCTION {_SCHEMA_PREFIX}set_last_updated() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.last_updated := clock_timestamp();
+        RETURN NEW;
+    END;
+    $$
+"""))
+for _t in Base.metadata.tables.values():
+    if "last_updated" in _t.c:
+        event.listen(_t, "after_create", DDL(
+            f"CREATE TRIGGER trg_{_t.name}_last_updated BEFORE UPDATE ON %(fullname)s "
+            f"FOR EACH ROW EXECUTE FUNCTION {_SCHEMA_PREFIX}set_last_updated()"
+        ))
+
+# Resolve relationships/secondary tables once, at import: configuration errors surface
+# here instead of on the first query, and the first request doesn't pay for it.
+Base.registry.configure()
@@ -5,8 +5,9 @@ from typing import Optional, List, TYPE_CHECKING
 from uuid import UUID as UUID_t
 
 from sqlalchemy import (
-    Boolean, DateTime, Enum as SAEnum, ForeignKey, Integer, BigInteger,
-    Numeric, String, Text, text, UniqueConstraint, CheckConstraint, Index, func,
+    DDL, Boolean, Computed, DateTime, Enum as SAEnum, ForeignKey, Integer, BigInteger,
+    Numeric, String, Text, column, event, table, text, UniqueConstraint,
+    CheckConstraint, Index, func, select,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -20,17 +21,18 @@ if TYPE_CHECKING:
     from hexmedia.database.models.taxonomy import Tag, MediaTag
     from hexmedia.database.models.person import Person, MediaPerson
 
-def _t(name: str):
-    schema = Base.metadata.schema  # e.g. "hexmedia"
-    key = f"{schema}.{name}" if schema else name
-    return Base.metadata.tables[key]
 
-class MediaItem(ServiceObject, Base):
+class MediaItem(ServiceObject):
     __tablename__ = "media_item"
     __table_args__ = (
+        # its unique index backs get_by_identity / get_many_by_identity (and prefix probes)
         UniqueConstraint("media_folder", "identity_name", "video_ext",
                          name="uq_mediaitem_folder_identity_ext"),
-        Index("ix_mediaitem_folder_identity", "media_folder", "identity_name"),
+        Index("ix_media_item_bucket", "bucket"),
+        # newest-first video scan for thumb candidates: ORDER BY ... LIMIT reads the top N
+        # entries off this index, no sort over the whole table
+        Index("ix_media_item_video_recent", text("date_created DESC NULLS LAST"),
+              postgresql_where=text("kind = 'video'")),
     )
 
     kind: Mapped[MediaKind] = mapped_column(SAEnum(MediaKind, name="media_kind"), nullable=False)
@@ -39,6 +41,10 @@ class MediaItem(ServiceObject, Base):
     media_folder: Mapped[str] = mapped_column(Text, nullable=False)   # 3-char bucket (e.g., '000', 'a1b')
     identity_name: Mapped[str] = mapped_column(Text, nullable=False)  # 12-char item id
     video_ext: Mapped[str] = mapped_column(String(16), nullable=False)
+    # first path segment of media_folder, computed once at write time (indexed for grouping)
+    bucket: Mapped[Optional[str]] = mapped_column(
+        Text, Computed("split_part(media_folder, '/', 1)", persisted=True)
+    )
 
     # file stats
     size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
@@ -77,17 +83,21 @@ class MediaItem(ServiceObject, Base):
     rating: Mapped["Rating | None"] = relationship(
         back_populates="media_item", uselist=False, cascade="all, delete-orphan", passive_deletes=True
     )
+    # Read-only views over the link tables: links are written as MediaTag / MediaPerson
+    # rows, and the FKs' ON DELETE CASCADE removes them, so the unit of work never has to
+    # track (or load, on delete) these collections.
     tags: Mapped[List["Tag"]] = relationship(
         "Tag",
-        secondary=lambda: _t("media_tag"),
-        back_populates="media_items"
+        secondary="media_tag",
+        back_populates="media_items",
+        viewonly=True,
     )
     people: Mapped[List["Person"]] = relationship(
-        "Person", secondary=lambda: _t("media_person"), back_populates="media_items"
+        "Person", secondary="media_person", back_populates="media_items", viewonly=True
     )
 
 
-class MediaAsset(ServiceObject, Base):
+class MediaAsset(ServiceObject):
     __tablename__ = "media_asset"
     __table_args__ = (UniqueConstraint("media_item_id", "kind", name="uq_media_asset_item_kind"),)
 
@@ -118,3 +128,43 @@ class Rating(Base):
     )
 
     media_item: Mapped[MediaItem] = relationship(back_populates="rating", passive_deletes=True)
+
+
+# ---------------------------------------------------------------------------
+# mv_media_bucket_counts: per-bucket item counts (migrations 9c3d5e1f7a48, 3e7a9b2c4d61)
+# ---------------------------------------------------------------------------
+_MV_BUCKETS = (
+    f"{Base.metadata.schema}.mv_media_bucket_counts" if Base.metadata.schema else "mv_media_bucket_counts"
+)
+
+# Lightweight selectable (not part of metadata, so create_all never makes it a table)
+media_bucket_counts = table(
+    "mv_media_bucket_counts", column("bucket", Text), column("n", BigInteger),
+    schema=Base.metadata.schema,
+)
+
+# Mirror the migration for metadata.create_all() (tests build the schema without Alembic)
+event.listen(MediaItem.__table__, "after_create", DDL(
+    f"CREATE MATERIALIZED VIEW {_MV_BUCKETS} AS "
+    "SELECT bucket, count(*) AS n "
+    "FROM %(fullname)s WHERE media_folder IS NOT NULL GROUP BY 1"
+))
+event.listen(MediaItem.__table__, "after_create", DDL(
+    f"CREATE UNIQUE INDEX ix_mv_media_bucket_counts_bucket ON {_MV_BUCKETS} (bucket)"
+))
+event.listen(MediaItem.__table__, "before_drop", DDL(f"DROP MATERIALIZED VIEW IF EXISTS {_MV_BUCKETS}"))
+
+REFRESH_MEDIA_BUCKET_COUNTS = text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {_MV_BUCKETS}")
+# Snapshot read for the /buckets/count listing: empty buckets filtered in SQL. The view is
+# refreshed by hexmedia.database.repos.bucket_counts, so it lags writes by a few seconds.
+SELECT_MEDIA_BUCKET_COUNTS = select(media_bucket_counts.c.bucket, media_bucket_counts.c.n).where(
+    media_bucket_counts.c.bucket != ""
+)
+# Exact per-bucket counts (both media repos' count_media_items_by_bucket): the ingest
+# planner balances buckets from these, so they must see every committed item. Served by
+# an index-only scan over ix_media_item_bucket.
+COUNT_MEDIA_ITEMS_BY_BUCKET = (
+    select(MediaItem.bucket, func.count())
+    .where(MediaItem.bucket != "")
+    .group_by(MediaItem.bucket)
+)
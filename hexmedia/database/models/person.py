@@ -5,7 +5,7 @@ from typing import Optional, List, TYPE_CHECKING
 from uuid import UUID as UUID_t
 
 from sqlalchemy import (
-    ForeignKey, String, Text, UniqueConstraint, Enum as SAEnum, text, func, Index
+    Computed, ForeignKey, String, Text, UniqueConstraint, Enum as SAEnum, text, func, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -18,31 +18,41 @@ if TYPE_CHECKING:
     from .media import MediaItem
 
 
-def _t(name: str):
-    """Return Table object from metadata, honoring schema on Base.metadata."""
-    schema = Base.metadata.schema  # e.g. "hexmedia"
-    key = f"{schema}.{name}" if schema else name
-    return Base.metadata.tables[key]
+def _normalized_sql(col: str) -> str:
+    # lowercase + collapse whitespace, computed by Postgres as a STORED generated column
+    return rf"lower(btrim(regexp_replace({col}, '\s+', ' ', 'g')))"
+
+
+def normalized_expr(value):
+    """
+    The generated columns' normalization as a SQL expression over `value` (a column or a
+    bind parameter). Compare alias_normalized / normalized_name against this rather than
+    a Python-side lower()/split(): Postgres' lower() and regex classes follow the ctype,
+    which need not agree with Python's Unicode rules for non-ASCII input.
+    """
+    return func.lower(func.btrim(func.regexp_replace(value, r"\s+", " ", "g")))
 
 
 # =======================
 # People
 # =======================
-class Person(ServiceObject, Base):
+class Person(ServiceObject):
     """
     New Person model:
-      - display_name, normalized_name
+      - display_name, normalized_name (generated from display_name by the DB)
       - optional notes, avatar_asset_id
       - many-to-many with PersonAlias through person_alias_link
     """
     __tablename__ = "people"
     __table_args__ = (
-        Index("ix_people_display_name_trgm", "display_name", postgresql_ops={"display_name": "gin_trgm_ops"}, postgresql_using="gin"),
-        Index("ix_people_normalized_name", "normalized_name"),
+        # search target; the GIN index also covers equality lookups (via recheck)
+        Index("ix_people_normalized_name_trgm", "normalized_name", postgresql_ops={"normalized_name": "gin_trgm_ops"}, postgresql_using="gin"),
     )
 
     display_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    normalized_name: Mapped[Optional[str]] = mapped_column(String(255))
+    normalized_name: Mapped[str] = mapped_column(
+        String(255), Computed(_normalized_sql("display_name"), persisted=True), nullable=False
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text)
     avatar_asset_id: Mapped[Optional[UUID_t]] = mapped_column(
         UUID(as_uuid=True),
@@ -50,26 +60,31 @@ class Person(ServiceObject, Base):
         nullable=True,
     )
 
-    # Media links (association table kept as "media_person")
+    # Media links (association table kept as "media_person"). Lazy by default; use
+    # selectinload(Person.media_items) per query (see Tag.media_items)
     media_items: Mapped[List["MediaItem"]] = relationship(
         "MediaItem",
-        secondary=lambda: _t("media_person"),
+        secondary="media_person",
         back_populates="people",
+        viewonly=True,  # see MediaItem.people
     )
 
-    # Alias links (M:M via person_alias_link)
+    # Alias links (M:M via person_alias_link). Never loaded implicitly: callers that
+    # render aliases opt in with selectinload(Person.aliases). Link rows go away via the
+    # FK's ON DELETE CASCADE, so deletes don't need the collection either.
     aliases: Mapped[List["PersonAlias"]] = relationship(
         "PersonAlias",
-        secondary=lambda: _t("person_alias_link"),
+        secondary="person_alias_link",
         back_populates="people",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         return f"<Person id={self.id} name={self.display_name!r}>"
 
 
-class PersonAlias(ServiceObject, Base):
+class PersonAlias(ServiceObject):
     """
     Aliases are global and can attach to multiple persons (M:M).
     We keep a global uniqueness on alias_normalized for dedup.
@@ -77,17 +92,22 @@ class PersonAlias(ServiceObject, Base):
     __tablename__ = "person_alias"
     __table_args__ = (
         UniqueConstraint("alias_normalized", name="uq_person_alias_normalized_global"),
+        # fuzzy lookup (`%` / ILIKE); the unique btree above keeps exact-match dedup
+        Index("ix_person_alias_normalized_trgm", "alias_normalized", postgresql_ops={"alias_normalized": "gin_trgm_ops"}, postgresql_using="gin"),
     )
 
     alias: Mapped[str] = mapped_column(String(255), nullable=False)
-    alias_normalized: Mapped[str] = mapped_column(String(255), nullable=False)
+    alias_normalized: Mapped[str] = mapped_column(
+        String(255), Computed(_normalized_sql("alias"), persisted=True), nullable=False
+    )
     notes: Mapped[Optional[str]] = mapped_column(Text)
 
     people: Mapped[List["Person"]] = relationship(
         "Person",
-        secondary=lambda: _t("person_alias_link"),
+        secondary="person_alias_link",
         back_populates="aliases",
-        lazy="selectin",
+        lazy="raise_on_sql",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
@@ -100,8 +120,9 @@ class PersonAliasLink(Base):
     """
     __tablename__ = "person_alias_link"
     __table_args__ = (
-        UniqueConstraint("person_id", "alias_id", name="uq_person_alias_link_person_alias"),
-        Index("ix_person_alias_link_alias_id", "alias_id"),
+        # (person_id, alias_id) uniqueness comes from the composite primary key
+        # covering: alias -> person_id lookups are index-only scans
+        Index("ix_person_alias_link_alias_id_pid", "alias_id", "person_id"),
     )
 
     person_id: Mapped[UUID_t] = mapped_column(
@@ -123,9 +144,10 @@ class MediaPerson(Base):
     """
     __tablename__ = "media_person"
     __table_args__ = (
-        UniqueConstraint("media_item_id", "person_id", name="uq_media_person_pair"),
-        Index("ix_media_person_media_item_id", "media_item_id"),
-        Index("ix_media_person_person_id", "person_id"),
+        # The composite PK (media_item_id, person_id) enforces pair uniqueness, and its
+        # index serves media_item_id-only filters (leftmost column)
+        # covering: person -> media_item_id lookups are index-only scans
+        Index("ix_media_person_person_id_mid", "person_id", "media_item_id"),
     )
 
     media_item_id: Mapped[UUID_t] = mapped_column(
@@ -6,7 +6,7 @@ from uuid import UUID as UUID_t
 
 from sqlalchemy import (
     Enum as SAEnum, ForeignKey, String,
-    Text, UniqueConstraint, CheckConstraint, Integer, Index, func
+    Text, UniqueConstraint, CheckConstraint, Integer, Index, func, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -18,17 +18,10 @@ if TYPE_CHECKING:
     from .media import MediaItem
 
 
-def _t(name: str):
-    """Return Table object from metadata, honoring schema on Base.metadata."""
-    schema = Base.metadata.schema  # e.g. "hexmedia"
-    key = f"{schema}.{name}" if schema else name
-    return Base.metadata.tables[key]
-
-
 # =======================
 # Tag groups (taxonomy)
 # =======================
-class TagGroup(ServiceObject, Base):
+class TagGroup(ServiceObject):
     __tablename__ = "tag_group"
     __table_args__ = (
         UniqueConstraint("parent_id", "key", name="uq_taggroup_parent_key"),
@@ -49,10 +42,14 @@ class TagGroup(ServiceObject, Base):
     path: Mapped[str] = mapped_column(Text, nullable=False)                # computed at app layer
     depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # 0=root
 
+    # many-to-one: JOIN the (tiny) parent row into the same SELECT instead of a
+    # per-object lazy load; the children collections stay lazy (no row explosion)
     parent: Mapped[Optional["TagGroup"]] = relationship(
         "TagGroup",
         remote_side="TagGroup.id",
         back_populates="children",
+        lazy="joined",
+        join_depth=1,  # self-referential: eager-join one level up, not the whole chain
     )
     children: Mapped[List["TagGroup"]] = relationship(
         "TagGroup",
@@ -66,7 +63,7 @@ class TagGroup(ServiceObject, Base):
 # =======================
 # Tags
 # =======================
-class Tag(ServiceObject, Base):
+class Tag(ServiceObject):
     __tablename__ = "tag"
     __table_args__ = (
         UniqueConstraint("group_id", "slug", name="uq_tag_group_slug"),
@@ -74,8 +71,11 @@ class Tag(ServiceObject, Base):
             "(parent_id IS NULL) OR (group_id IS NOT NULL)",
             name="ck_tag_parent_requires_group",
         ),
-        Index("ix_tag_parent_id", "parent_id"),
-        Index("ix_tag_group_id", "group_id"),
+        # group_id-only filters use uq_tag_group_slug (leftmost column). parent_id lookups
+        # (children loads, ON DELETE SET NULL) only ever match non-null values.
+        Index("ix_tag_parent_id", "parent_id", postgresql_where=text("parent_id IS NOT NULL")),
+        # substring/similarity search (name ILIKE '%q%', name % q)
+        Index("ix_tag_name_trgm", "name", postgresql_ops={"name": "gin_trgm_ops"}, postgresql_using="gin"),
     )
 
     group_id: Mapped[Optional[UUID_t]] = mapped_column(
@@ -90,13 +90,16 @@ class Tag(ServiceObject, Base):
         nullable=True,
     )
 
-    group: Mapped[Optional["TagGroup"]] = relationship(back_populates="tags")
+    # many-to-one lookups are joined into the Tag SELECT (see TagGroup.parent)
+    group: Mapped[Optional["TagGroup"]] = relationship(back_populates="tags", lazy="joined")
 
     # Self-referential tree
     parent: Mapped[Optional["Tag"]] = relationship(
         "Tag",
         remote_side="Tag.id",
         back_populates="children",
+        lazy="joined",
+        join_depth=1,  # self-referential: eager-join one level up, not the whole chain
     )
     children: Mapped[List["Tag"]] = relationship(
         "Tag",
@@ -105,11 +108,14 @@ class Tag(ServiceObject, Base):
         single_parent=True,
     )
 
-    # Many-to-many to media items through association table
+    # Many-to-many to media items through association table. Left lazy (a tag can have
+    # thousands of items); eager-load per query with selectinload(Tag.media_items), which
+    # already omits the JOIN back to tag (omit_join is auto-detected; don't set it)
     media_items: Mapped[List["MediaItem"]] = relationship(
         "MediaItem",
-        secondary=lambda: _t("media_tag"),
+        secondary="media_tag",
         back_populates="tags",
+        viewonly=True,  # see MediaItem.tags
     )
 Index("ix_tag_name_lower", func.lower(Tag.name))
 
@@ -117,7 +123,8 @@ class MediaTag(Base):
     __tablename__ = "media_tag"
     __table_args__ = (
         UniqueConstraint("media_item_id", "tag_id", name="uq_media_tag_item_tag"),
-        Index("ix_media_tag_tag_id", "tag_id"),
+        # covering: tag -> media_item_id lookups are index-only scans
+        Index("ix_media_tag_tag_id_mid", "tag_id", "media_item_id"),
     )
 
     media_item_id: Mapped[UUID_t] = mapped_column(
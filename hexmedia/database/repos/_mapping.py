@@ -1,40 +1,89 @@
 # hexmedia/database/repos/_mapping.py
 from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import fields
+from typing import Any, Callable, Tuple
+
+from sqlalchemy import Row, inspect
+
 from hexmedia.database.models.media import MediaItem as DBMediaItem
 from hexmedia.domain.entities.media_item import MediaItem as DomainMediaItem, MediaIdentity
 from hexmedia.domain.enums.media_kind import MediaKind
 
+# Bounded LRU of converted rows keyed by (id, last_updated). last_updated is bumped by a
+# trigger on every UPDATE, so a changed row gets a new key; sharing instances is safe
+# because DomainMediaItem is frozen.
+_CACHE: "OrderedDict[Tuple, DomainMediaItem]" = OrderedDict()
+_CACHE_MAX = 10_000
+_CACHE_LOCK = threading.Lock()
+
+# Column keys copied 1:1 onto the domain entity (resolved once, at import); the identity
+# triplet is nested in MediaIdentity, and DB-only columns (meta_data, bucket) are skipped.
+_IDENTITY_COLS = ("media_folder", "identity_name", "video_ext")
+_DOMAIN_FIELDS = {f.name for f in fields(DomainMediaItem)}
+_COLS = tuple(c.key for c in DBMediaItem.__table__.columns if c.key in _DOMAIN_FIELDS)
+
+
+# Core select list for row_to_domain_media_item(): exactly the columns the mapping reads
+MEDIA_ITEM_COLUMNS = tuple(getattr(DBMediaItem, k) for k in _COLS + _IDENTITY_COLS)
+
+
 def to_domain_media_item(row: DBMediaItem) -> DomainMediaItem:
-    # Minimal, same as your _to_domain (removed logging noise)
-    return DomainMediaItem(
-        id=row.id,
-        kind=row.kind if isinstance(row.kind, MediaKind) else MediaKind(row.kind),
-        identity=MediaIdentity(
-            media_folder=row.media_folder,
-            identity_name=row.identity_name,
-            video_ext=row.video_ext,
-        ),
-        size_bytes=row.size_bytes,
-        hash_sha256=row.hash_sha256,
-        duration_sec=row.duration_sec,
-        width=row.width,
-        height=row.height,
-        fps=float(row.fps) if row.fps is not None else None,
-        bitrate=row.bitrate,
-        codec_video=row.codec_video,
-        codec_audio=row.codec_audio,
-        container=row.container,
-        aspect_ratio=row.aspect_ratio,
-        language=row.language,
-        has_subtitles=row.has_subtitles,
-        title=row.title,
-        release_year=row.release_year,
-        source=row.source,
-        watched=row.watched,
-        favorite=row.favorite,
-        last_played_at=row.last_played_at,
-        # date_created/last_updated/data_origin if present on your ORM base
-        date_created=getattr(row, "date_created", None),
-        last_updated=getattr(row, "last_updated", None),
-        data_origin=getattr(row, "data_origin", None),
-    )
+    # Rows with unflushed changes don't match their stored last_updated: convert directly
+    if inspect(row).modified:
+        return _to_domain(row)
+    return _cached((row.id, row.last_updated), _to_domain, row)
+
+
+def row_to_domain_media_item(row: Row) -> DomainMediaItem:
+    """
+    Map a Core row selected with MEDIA_ITEM_COLUMNS: no ORM instance, identity-map entry
+    or attribute instrumentation is created for it.
+    """
+    return _cached((row.id, row.last_updated), _from_row, row)
+
+
+def _cached(key: Tuple, build: Callable[[Any], DomainMediaItem], src: Any) -> DomainMediaItem:
+    if key[0] is None or key[1] is None:
+        return build(src)
+
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            return hit
+
+    item = build(src)
+    with _CACHE_LOCK:
+        _CACHE[key] = item
+        if len(_CACHE) > _CACHE_MAX:
+            _CACHE.popitem(last=False)
+    return item
+
+
+def _to_domain(row: DBMediaItem) -> DomainMediaItem:
+    state = row.__dict__
+    try:
+        # loaded values straight from the instance dict: no per-attribute descriptor calls
+        data = {k: state[k] for k in _COLS}
+        ident = [state[k] for k in _IDENTITY_COLS]
+    except KeyError:
+        # expired/unloaded attribute: go through the descriptors (which load it)
+        data = {k: getattr(row, k) for k in _COLS}
+        ident = [getattr(row, k) for k in _IDENTITY_COLS]
+    return _build(data, ident)
+
+
+def _from_row(row: Row) -> DomainMediaItem:
+    m = row._mapping
+    return _build({k: m[k] for k in _COLS}, [m[k] for k in _IDENTITY_COLS])
+
+
+def _build(data: dict, ident: list) -> DomainMediaItem:
+    kind = data["kind"]
+    data["kind"] = kind if isinstance(kind, MediaKind) else MediaKind(kind)
+    if data["fps"] is not None:
+        data["fps"] = float(data["fps"])  # Numeric -> Decimal -> float
+    return DomainMediaItem(identity=MediaIdentity(*ident), **data)
@@ -0,0 +1,95 @@
+# hexmedia/database/repos/bucket_counts.py
+from __future__ import annotations
+
+import threading
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, sessionmaker
+
+from hexmedia.common.logging import get_logger
+from hexmedia.database.models.media import MediaItem as DBMediaItem, REFRESH_MEDIA_BUCKET_COUNTS
+
+logger = get_logger()
+
+# Keeps mv_media_bucket_counts (the /buckets/count snapshot) roughly current. Nothing that
+# needs exact counts reads the view: count_media_items_by_bucket() queries media_item.
+# Hooks go on the session factories the app opts in via install_bucket_count_refresh(),
+# never on Session globally, so importing the models or repos starts no threads.
+
+_BUCKETS_DIRTY = "hexmedia.media_buckets_dirty"
+
+# Commits that dirty the buckets within this window share one refresh
+_BUCKET_REFRESH_DELAY_SEC = 2.0
+_refresh_pending: set = set()  # engines with a refresh scheduled
+_refresh_lock = threading.Lock()
+
+
+def _mark_after_flush(session: Session, flush_context) -> None:
+    if session.info.get(_BUCKETS_DIRTY):
+        return
+    for obj in (*session.new, *session.deleted):
+        if isinstance(obj, DBMediaItem):
+            session.info[_BUCKETS_DIRTY] = True
+            return
+    for obj in session.dirty:
+        if isinstance(obj, DBMediaItem) and inspect(obj).attrs.media_folder.history.has_changes():
+            session.info[_BUCKETS_DIRTY] = True
+            return
+
+
+def _mark_on_bulk_dml(orm_execute_state) -> None:
+    # insert()/update()/delete() against MediaItem bypass the flush
+    if (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete) \
+            and orm_execute_state.bind_mapper is not None \
+            and orm_execute_state.bind_mapper.class_ is DBMediaItem:
+        orm_execute_state.session.info[_BUCKETS_DIRTY] = True
+
+
+def _run_refresh(engine) -> None:
+    with _refresh_lock:
+        # commits landing from here on schedule the next refresh
+        _refresh_pending.discard(engine)
+    try:
+        with engine.begin() as conn:
+            conn.execute(REFRESH_MEDIA_BUCKET_COUNTS)
+    except Exception:
+        # the data is committed already; the snapshot stays stale until the next refresh
+        logger.warning("refresh of mv_media_bucket_counts failed", exc_info=True)
+
+
+def _schedule_after_commit(session: Session) -> None:
+    # Only commits that added, removed or re-bucketed items schedule a refresh, and a burst
+    # of them (an ingest run) is debounced into one. It runs on its own connection off a
+    # timer thread; CONCURRENTLY keeps readers of the view unblocked meanwhile.
+    if not session.info.pop(_BUCKETS_DIRTY, False):
+        return
+    engine = session.get_bind().engine
+    with _refresh_lock:
+        if engine in _refresh_pending:
+            return
+        _refresh_pending.add(engine)
+    timer = threading.Timer(_BUCKET_REFRESH_DELAY_SEC, _run_refresh, args=(engine,))
+    timer.daemon = True
+    timer.start()
+
+
+def _clear_after_rollback(session: Session) -> None:
+    session.info.pop(_BUCKETS_DIRTY, None)
+
+
+_HOOKS = (
+    ("after_flush", _mark_after_flush),
+    ("do_orm_execute", _mark_on_bulk_dml),
+    ("after_commit", _schedule_after_commit),
+    ("after_rollback", _clear_after_rollback),
+)
+
+
+def install_bucket_count_refresh(factory: sessionmaker) -> None:
+    """
+    Refresh mv_media_bucket_counts shortly after commits (from sessions made by `factory`)
+    that add, remove or re-bucket media items. Idempotent.
+    """
+    for name, fn in _HOOKS:
+        if not event.contains(factory, name, fn):
+            event.listen(factory, name, fn)
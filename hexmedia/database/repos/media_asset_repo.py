@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, and_
+from sqlalchemy import bindparam, select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
@@ -11,6 +12,22 @@ from hexmedia.database.models.media import MediaAsset as DBMediaAsset
 from hexmedia.domain.enums.asset_kind import AssetKind
 
 
+# Built once; executed with parameters so each call reuses the cached compiled form
+_BY_ITEM_KIND = select(DBMediaAsset).where(
+    and_(
+        DBMediaAsset.media_item_id == bindparam("media_item_id"),
+        DBMediaAsset.kind == bindparam("kind"),
+    )
+).limit(1)
+# uq_media_asset_item_kind's (media_item_id, kind) index returns rows already in kind
+# order (enum declaration order, as ORDER BY sorts), so an index scan needs no Sort node
+_BY_ITEM = (
+    select(DBMediaAsset)
+    .where(DBMediaAsset.media_item_id == bindparam("media_item_id"))
+    .order_by(DBMediaAsset.kind.asc())
+)
+
+
 class SqlAlchemyMediaAssetRepo:
     def __init__(self, session: Session) -> None:
         self.db = session
@@ -21,21 +38,12 @@ class SqlAlchemyMediaAssetRepo:
         return self.db.get(DBMediaAsset, asset_id)
 
     def list_by_media(self, media_item_id: UUID) -> List[DBMediaAsset]:
-        stmt = (
-            select(DBMediaAsset)
-            .where(DBMediaAsset.media_item_id == media_item_id)
-            .order_by(DBMediaAsset.kind.asc())
-        )
-        return self.db.execute(stmt).scalars().all()
+        return self.db.execute(_BY_ITEM, {"media_item_id": media_item_id}).scalars().all()
 
     def get_by_item_kind(self, media_item_id: UUID, kind: AssetKind) -> Optional[DBMediaAsset]:
-        stmt = select(DBMediaAsset).where(
-            and_(
-                DBMediaAsset.media_item_id == media_item_id,
-                DBMediaAsset.kind == kind,
-            )
-        ).limit(1)
-        return self.db.execute(stmt).scalars().first()
+        return self.db.execute(
+            _BY_ITEM_KIND, {"media_item_id": media_item_id, "kind": kind}
+        ).scalars().first()
 
     # --------- Writes ---------
 
@@ -68,19 +76,54 @@ class SqlAlchemyMediaAssetRepo:
         width: int | None = None,
         height: int | None = None,
     ) -> DBMediaAsset:
-        existing = self.get_by_item_kind(media_item_id, kind)
-        if existing:
-            existing.rel_path = rel_path
-            existing.width = width
-            existing.height = height
-            return existing
-        return self.create(
+        # One INSERT ... ON CONFLICT (media_item_id, kind) DO UPDATE round-trip instead of
+        # SELECT-then-INSERT/UPDATE; also race-free under concurrent writers.
+        ins = pg_insert(DBMediaAsset).values(
             media_item_id=media_item_id,
             kind=kind,
             rel_path=rel_path,
             width=width,
             height=height,
         )
+        stmt = ins.on_conflict_do_update(
+            index_elements=[DBMediaAsset.media_item_id, DBMediaAsset.kind],
+            set_={
+                "rel_path": ins.excluded.rel_path,
+                "width": ins.excluded.width,
+                "height": ins.excluded.height,
+            },
+        ).returning(DBMediaAsset)
+        return self.db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+    def upsert_many(self, rows: List[dict]) -> List[UUID]:
+        """
+        Upsert many assets in one multi-row INSERT ... ON CONFLICT DO UPDATE.
+        Each row: media_item_id, kind, rel_path[, width, height]. Returns the asset ids.
+        """
+        # Postgres rejects a statement that touches the same conflict key twice: last wins
+        by_key = {(r["media_item_id"], r["kind"]): r for r in rows}
+        if not by_key:
+            return []
+        values = [
+            {
+                "media_item_id": r["media_item_id"],
+                "kind": r["kind"],
+                "rel_path": r["rel_path"],
+                "width": r.get("width"),
+                "height": r.get("height"),
+            }
+            for r in by_key.values()
+        ]
+        ins = pg_insert(DBMediaAsset).values(values)
+        stmt = ins.on_conflict_do_update(
+            index_elements=[DBMediaAsset.media_item_id, DBMediaAsset.kind],
+            set_={
+                "rel_path": ins.excluded.rel_path,
+                "width": ins.excluded.width,
+                "height": ins.excluded.height,
+            },
+        ).returning(DBMediaAsset.id)
+        return list(self.db.execute(stmt).scalars())
 
     def update(
         self,
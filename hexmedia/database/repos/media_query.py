@@ -1,21 +1,124 @@
 # hexmedia/database/repos/media_query.py
 from __future__ import annotations
-from typing import Iterable, Optional, List, Tuple, Literal, Set
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple, Literal, Set
 from uuid import UUID
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import Session, aliased
+from sqlalchemy import Integer, Select, bindparam, literal, select, func, and_, or_, tuple_
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from hexmedia.database.models import (
     MediaItem as DBMediaItem,
     MediaAsset as DBMediaAsset,
     Person as DBPerson,
     MediaPerson as DBMediaPerson,
-    Rating as DBRating,
 )
+from hexmedia.database.models.media import COUNT_MEDIA_ITEMS_BY_BUCKET, SELECT_MEDIA_BUCKET_COUNTS
 from hexmedia.domain.entities.media_item import MediaItem as DomainMediaItem, MediaIdentity
 from hexmedia.domain.enums.media_kind import MediaKind
 from hexmedia.domain.enums.asset_kind import AssetKind
-from hexmedia.database.repos._mapping import to_domain_media_item
+from hexmedia.database.repos._mapping import (
+    MEDIA_ITEM_COLUMNS, row_to_domain_media_item, to_domain_media_item,
+)
+
+# Hot lookups built once at import and executed with parameters: no per-call select()
+# construction, and every call hits the same compiled-statement cache entry.
+# Column-only reads (counts, hash probe, folders) run on session.connection(): no ORM
+# compile/loading context and no autoflush. Media inserts are executed statements, not
+# pending session objects, so there is nothing unflushed for them to miss.
+_BY_ID = select(*MEDIA_ITEM_COLUMNS).where(DBMediaItem.id == bindparam("id"))
+_BY_IDENTITY = (
+    select(DBMediaItem)
+    .where(
+        DBMediaItem.media_folder == bindparam("media_folder"),
+        DBMediaItem.identity_name == bindparam("identity_name"),
+        DBMediaItem.video_ext == bindparam("video_ext"),
+    )
+    .limit(1)
+)
+# Identity lookup and hash probe in one round trip: a one-row SELECT 1 outer-joined to the
+# identity match (NULL entity when absent), with the hash EXISTS projected beside it
+_ONE_ROW = select(literal(1).label("one")).subquery("one_row")
+_IDENTITY_AND_HASH = (
+    select(
+        DBMediaItem,
+        select(literal(1))
+        .where(DBMediaItem.hash_sha256 == bindparam("sha256"))
+        .exists()
+        .label("hash_exists"),
+    )
+    .select_from(_ONE_ROW)
+    .outerjoin(
+        DBMediaItem,
+        and_(
+            DBMediaItem.media_folder == bindparam("media_folder"),
+            DBMediaItem.identity_name == bindparam("identity_name"),
+            DBMediaItem.video_ext == bindparam("video_ext"),
+        ),
+    )
+)
+# Identities per get_many_by_identity statement (3 bind params each; libpq caps at 65535)
+_IDENTITY_BATCH = 1000
+_COUNT_ALL = select(func.count()).select_from(DBMediaItem)
+# Existence probe: stops at the first hit on the hash_sha256 unique index
+_HASH_EXISTS = select(literal(1)).where(DBMediaItem.hash_sha256 == bindparam("sha256")).limit(1)
+# Full-table scan streamed through a server-side cursor, fetched 1000 rows at a time, so
+# memory stays flat however many items exist. One row per item (no DISTINCT): callers
+# derive per-bucket item counts from it.
+_MEDIA_FOLDERS = (
+    select(DBMediaItem.media_folder)
+    .where(DBMediaItem.media_folder.is_not(None))
+    .execution_options(yield_per=1000, stream_results=True)
+)
+
+# Loader options per list_media_by_bucket include key, built once
+_INCLUDE_LOADERS = {
+    "assets": selectinload(DBMediaItem.assets),
+    # people only: the by-bucket cards' PersonRead has no aliases
+    "persons": selectinload(DBMediaItem.people),
+    "ratings": joinedload(DBMediaItem.rating),
+    "tags": selectinload(DBMediaItem.tags),
+}
+
+
+@lru_cache(maxsize=4)
+def _candidates_stmt(regenerate: bool, missing: str) -> Select:
+    """
+    Thumb-candidate statement per (regenerate, missing) variant, built once and reused;
+    the row limit is a bind parameter.
+    """
+    MI = DBMediaItem
+    MA = DBMediaAsset
+
+    stmt = select(
+        MI.id,
+        MI.media_folder,
+        MI.identity_name,
+        MI.video_ext,
+    ).where(MI.kind == MediaKind.video)
+
+    if not regenerate:
+        # Anti-joins: each NOT EXISTS is one probe of uq_media_asset_item_kind per item
+        # that stops at the first match, instead of outer-joining asset rows then
+        # filtering on NULLs.
+        def _lacks(kind: AssetKind):
+            return ~(
+                select(literal(1))
+                .where(MA.media_item_id == MI.id, MA.kind == kind)
+                .exists()
+            )
+
+        no_thumb = _lacks(AssetKind.thumb)
+        no_sheet = _lacks(AssetKind.contact_sheet)
+        if missing == "both":
+            stmt = stmt.where(and_(no_thumb, no_sheet))
+        else:  # "either"
+            stmt = stmt.where(or_(no_thumb, no_sheet))
+
+    return (
+        stmt.order_by(MI.date_created.desc().nullslast())
+        .limit(bindparam("limit", type_=Integer))
+    )
+
 
 class MediaQueryRepo:
     """
@@ -26,55 +129,99 @@ class MediaQueryRepo:
         self.session = session
 
     def iter_media_folders(self) -> Iterable[str]:
-        stmt = select(DBMediaItem.media_folder)
-        for (mf,) in self.session.execute(stmt):
+        for (mf,) in self.session.connection().execute(_MEDIA_FOLDERS):
             if mf:
                 yield mf
 
     def count_media_items_by_bucket(self) -> dict[str, int]:
-        bucket = func.split_part(DBMediaItem.media_folder, "/", 1)
-        stmt = select(bucket.label("bucket"), func.count().label("n")).group_by(bucket)
-        rows = self.session.execute(stmt).all()
-        return {b: int(n) for (b, n) in rows if b}
+        # exact (the ingest planner balances buckets from it); GROUP BY over ix_media_item_bucket
+        return dict(self.session.connection().execute(COUNT_MEDIA_ITEMS_BY_BUCKET).all())
+
+    def bucket_counts_snapshot(self) -> dict[str, int]:
+        """
+        Per-bucket counts from mv_media_bucket_counts, for listings. Eventually consistent:
+        the view is refreshed a few seconds after commits that add, remove or re-bucket
+        items (see repos.bucket_counts). Use count_media_items_by_bucket() for exact counts.
+        """
+        return dict(self.session.connection().execute(SELECT_MEDIA_BUCKET_COUNTS).all())
 
     def exists_hash(self, sha256: str) -> bool:
-        stmt = select(func.count()).select_from(DBMediaItem).where(DBMediaItem.hash_sha256 == sha256)
-        return self.session.execute(stmt).scalar_one() > 0
+        return self.session.connection().execute(_HASH_EXISTS, {"sha256": sha256}).first() is not None
 
     def get_by_id(self, media_item_id: UUID) -> Optional[DomainMediaItem]:
-        row = self.session.get(DBMediaItem, media_item_id)
-        return to_domain_media_item(row) if row else None
+        # An instance already in the session is free and carries any unflushed changes;
+        # otherwise read plain columns, without hydrating an ORM instance
+        orm = self.session.identity_map.get(self.session.identity_key(DBMediaItem, media_item_id))
+        if orm is not None:
+            return to_domain_media_item(orm)
+        row = self.session.execute(_BY_ID, {"id": media_item_id}).first()
+        return row_to_domain_media_item(row) if row else None
 
     def get_by_identity(self, identity: MediaIdentity) -> Optional[DomainMediaItem]:
         # Include the full identity triplet for precision
-        stmt = (
-            select(DBMediaItem)
-            .where(
-                DBMediaItem.media_folder == identity.media_folder,
-                DBMediaItem.identity_name == identity.identity_name,
-                DBMediaItem.video_ext == identity.video_ext,
-            )
-            .limit(1)
-        )
-        row = self.session.execute(stmt).scalars().first()
+        row = self.session.execute(
+            _BY_IDENTITY,
+            {
+                "media_folder": identity.media_folder,
+                "identity_name": identity.identity_name,
+                "video_ext": identity.video_ext,
+            },
+        ).scalars().first()
         return to_domain_media_item(row) if row else None
 
+    def probe_identity_and_hash(
+        self, identity: MediaIdentity, sha256: str
+    ) -> Tuple[Optional[DomainMediaItem], bool]:
+        """
+        get_by_identity() and exists_hash() in a single statement, for ingest paths that
+        need both per file. Returns (item or None, hash already present).
+        """
+        row, hash_exists = self.session.execute(
+            _IDENTITY_AND_HASH,
+            {
+                "media_folder": identity.media_folder,
+                "identity_name": identity.identity_name,
+                "video_ext": identity.video_ext,
+                "sha256": sha256,
+            },
+        ).one()
+        return (to_domain_media_item(row) if row else None), bool(hash_exists)
+
+    def get_many_by_identity(
+        self, identities: Iterable[MediaIdentity]
+    ) -> Dict[Tuple[str, str, str], DomainMediaItem]:
+        """
+        Resolve many identities with one `(media_folder, identity_name, video_ext) IN (...)`
+        query per batch (served by uq_mediaitem_folder_identity_ext) instead of one
+        round-trip each. Returns {identity triplet: item}; identities not found are absent.
+        """
+        keys = list(dict.fromkeys(i.as_key() for i in identities))
+        triplet = tuple_(DBMediaItem.media_folder, DBMediaItem.identity_name, DBMediaItem.video_ext)
+        out: Dict[Tuple[str, str, str], DomainMediaItem] = {}
+        for start in range(0, len(keys), _IDENTITY_BATCH):
+            stmt = select(DBMediaItem).where(triplet.in_(keys[start:start + _IDENTITY_BATCH]))
+            for row in self.session.execute(stmt).scalars():
+                item = to_domain_media_item(row)
+                out[item.identity_key()] = item
+        return out
+
     def list_media_items(self, *, limit: int = 50, offset: int = 0) -> list[DomainMediaItem]:
         """
         Return a page of media items ordered by newest first.
         Router can convert to Read DTOs.
         """
+        # Core column select on the connection: plain rows, no ORM instances to hydrate and
+        # track, each mapped as it is read off the result (no intermediate row list)
         stmt = (
-            select(DBMediaItem)
+            select(*MEDIA_ITEM_COLUMNS)
             .order_by(DBMediaItem.date_created.desc().nullslast())
             .offset(offset)
             .limit(limit)
         )
-        rows = self.session.execute(stmt).scalars().all()
-        return [to_domain_media_item(r) for r in rows]
+        return [row_to_domain_media_item(r) for r in self.session.connection().execute(stmt)]
 
     def count_media_items(self) -> int:
-        return int(self.session.execute(select(func.count()).select_from(DBMediaItem)).scalar_one())
+        return int(self.session.connection().execute(_COUNT_ALL).scalar_one())
 
     def find_video_candidates_for_thumbs(
         self,
@@ -96,58 +243,12 @@ class MediaQueryRepo:
         rel_dir   = "<media_folder>/<identity_name>"
         file_name = "<identity_name>.<video_ext>"
         """
-        MI = DBMediaItem
-        MA = DBMediaAsset
-
-        base = select(
-            MI.id,
-            MI.media_folder,
-            MI.identity_name,
-            MI.video_ext,
-        ).where(MI.kind == MediaKind.video)
-
-        if regenerate:
-            stmt = base.order_by(MI.date_created.desc().nullslast()).limit(limit)
-        else:
-            Thumb = aliased(MA)
-            Sheet = aliased(MA)
-
-            stmt = (
-                base
-                .outerjoin(
-                    Thumb,
-                    and_(
-                        Thumb.media_item_id == MI.id,
-                        Thumb.kind == AssetKind.thumb,
-                    ),
-                )
-                .outerjoin(
-                    Sheet,
-                    and_(
-                        Sheet.media_item_id == MI.id,
-                        Sheet.kind == AssetKind.contact_sheet,
-                    ),
-                )
-            )
-
-            if missing == "both":
-                cond = and_(Thumb.id.is_(None), Sheet.id.is_(None))
-            else:  # "either"
-                cond = or_(Thumb.id.is_(None), Sheet.id.is_(None))
-
-            stmt = (
-                stmt.where(cond)
-                .order_by(MI.date_created.desc().nullslast())
-                .limit(limit)
-            )
-
-        rows: List[Tuple[str, str, str, str]] = self.session.execute(stmt).all()
-        out: list[tuple[str, str, str]] = []
-        for (mid, folder, name, ext) in rows:
-            rel_dir = f"{folder}/{name}"
-            file_name = f"{name}.{ext}"
-            out.append((str(mid), rel_dir, file_name))
-        return out
+        stmt = _candidates_stmt(regenerate, "either" if regenerate else missing)
+        # (id, rel_dir, file_name) built in one comprehension with plain concatenation
+        return [
+            (str(mid), folder + "/" + name, name + "." + ext)
+            for (mid, folder, name, ext) in self.session.execute(stmt, {"limit": limit})
+        ]
 
     def media_file_exists(self, media_root, rel_dir: str, file_name: str) -> bool:
         from pathlib import Path
@@ -178,49 +279,17 @@ class MediaQueryRepo:
         """
         Return all MediaItems in a single bucket (media_folder == bucket),
         newest first. No pagination here — assume bucket max is controlled in settings/env.
+
+        `include` ("assets", "persons", "ratings", "tags") eager-loads those relationships
+        on the returned rows: one SELECT ... IN per collection (selectinload), the rating
+        joined into the main query. Anything not requested raises on access instead of
+        lazy-loading one row at a time.
         """
         include = include or set()
         stmt = (
             select(DBMediaItem)
             .where(DBMediaItem.media_folder == bucket)
-            .order_by(DBMediaItem.date_created.desc().nullslast())
+            .order_by(DBMediaItem.date_created.desc().nullslast(), DBMediaItem.id.desc())
         )
-        rows = self.session.execute(stmt).scalars().all()
-        if not rows:
-            return []
-
-        # NOTE: We return DB models; router will attach embedded data if requested.
-        return rows
-
-    def batch_assets_for_items(self, item_ids: list[UUID]) -> dict[UUID, list[DBMediaAsset]]:
-        if not item_ids:
-            return {}
-        stmt = (
-            select(DBMediaAsset)
-            .where(DBMediaAsset.media_item_id.in_(item_ids))
-            .order_by(DBMediaAsset.kind.asc())
-        )
-        out: dict[UUID, list[DBMediaAsset]] = {}
-        for a in self.session.execute(stmt).scalars().all():
-            out.setdefault(a.media_item_id, []).append(a)
-        return out
-
-    def batch_persons_for_items(self, item_ids: list[UUID]) -> dict[UUID, list[DBPerson]]:
-        if not item_ids:
-            return {}
-        stmt = (
-            select(DBPerson, DBMediaPerson.media_item_id)
-            .join(DBMediaPerson, DBMediaPerson.person_id == DBPerson.id)
-            .where(DBMediaPerson.media_item_id.in_(item_ids))
-            .order_by(DBPerson.display_name.asc())
-        )
-        out: dict[UUID, list[DBPerson]] = {}
-        for person, media_item_id in self.session.execute(stmt).all():
-            out.setdefault(media_item_id, []).append(person)
-        return out
-
-    def batch_ratings_for_items(self, item_ids: list[UUID]) -> dict[UUID, int]:
-        if not item_ids:
-            return {}
-        stmt = select(DBRating.media_item_id, DBRating.score).where(DBRating.media_item_id.in_(item_ids))
-        return {mid: int(score) for (mid, score) in self.session.execute(stmt).all()}
\ No newline at end of file
+        stmt = stmt.options(*(_INCLUDE_LOADERS[k] for k in include if k in _INCLUDE_LOADERS), raiseload("*"))
+        return list(self.session.execute(stmt).unique().scalars())
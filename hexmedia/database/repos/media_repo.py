@@ -4,19 +4,51 @@ from __future__ import annotations
 from typing import Iterable, Optional, Any, Union, overload
 from uuid import UUID
 
-from sqlalchemy import select, func, delete as sa_delete
+from sqlalchemy import bindparam, insert, literal, select, delete as sa_delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 # DB models
-from hexmedia.database.models.media import MediaItem as DBMediaItem
+from hexmedia.database.models.media import MediaItem as DBMediaItem, COUNT_MEDIA_ITEMS_BY_BUCKET
 # Domain entities / value objects
 from hexmedia.domain.entities.media_item import MediaItem as DomainMediaItem, MediaIdentity
 from hexmedia.domain.enums.media_kind import MediaKind
 from hexmedia.common.logging import get_logger
-from hexmedia.database.repos._mapping import to_domain_media_item
+from hexmedia.database.repos._mapping import (
+    MEDIA_ITEM_COLUMNS, row_to_domain_media_item, to_domain_media_item,
+)
 
 
 logger = get_logger()
+
+# Query-port statements built once at import and executed with parameters: no per-call
+# select() construction, and each call hits the same compiled-statement cache entry.
+# The column-only ones run on session.connection(), skipping ORM execution and autoflush.
+_BY_ID = select(*MEDIA_ITEM_COLUMNS).where(DBMediaItem.id == bindparam("id"))
+_BY_IDENTITY = (
+    select(DBMediaItem)
+    .where(
+        DBMediaItem.media_folder == bindparam("media_folder"),
+        DBMediaItem.identity_name == bindparam("identity_name"),
+        DBMediaItem.video_ext == bindparam("video_ext"),
+    )
+    .limit(1)
+)
+# Existence probe: stops at the first hit on the hash_sha256 unique index
+_HASH_EXISTS = select(literal(1)).where(DBMediaItem.hash_sha256 == bindparam("sha256")).limit(1)
+# Batched probe: which of these hashes are already stored (one IN list per chunk)
+_HASHES_PRESENT = select(DBMediaItem.hash_sha256).where(
+    DBMediaItem.hash_sha256.in_(bindparam("hashes", expanding=True))
+)
+_HASH_BATCH = 1000
+# server-side cursor in 1000-row batches instead of buffering the whole table
+_MEDIA_FOLDERS = (
+    select(DBMediaItem.media_folder)
+    .where(DBMediaItem.media_folder.is_not(None))
+    .execution_options(yield_per=1000, stream_results=True)
+)
+
+
 class SqlAlchemyMediaRepo:
     """
     SQLAlchemy-backed repository that satisfies:
@@ -39,34 +71,46 @@ class SqlAlchemyMediaRepo:
     # MediaQueryPort
     # -------------------------------------------------------------------------
     def get_by_id(self, media_item_id: UUID) -> Optional[DomainMediaItem]:
-        row = self.db.get(DBMediaItem, media_item_id)
-        return to_domain_media_item(row) if row else None
+        # An instance already in the session is free and carries any unflushed changes;
+        # otherwise read plain columns, without hydrating an ORM instance
+        orm = self.db.identity_map.get(self.db.identity_key(DBMediaItem, media_item_id))
+        if orm is not None:
+            return to_domain_media_item(orm)
+        row = self.db.execute(_BY_ID, {"id": media_item_id}).first()
+        return row_to_domain_media_item(row) if row else None
 
     def get_by_identity(self, identity: MediaIdentity) -> Optional[DomainMediaItem]:
-        stmt = (
-            select(DBMediaItem)
-            .where(
-                DBMediaItem.media_folder == identity.media_folder,
-                DBMediaItem.identity_name == identity.identity_name,
-                DBMediaItem.video_ext == identity.video_ext,
-            )
-            .limit(1)
-        )
-        row = self.db.execute(stmt).scalars().first()
+        row = self.db.execute(
+            _BY_IDENTITY,
+            {
+                "media_folder": identity.media_folder,
+                "identity_name": identity.identity_name,
+                "video_ext": identity.video_ext,
+            },
+        ).scalars().first()
         return to_domain_media_item(row) if row else None
 
     def exists_hash(self, sha256: str) -> bool:
-        stmt = select(func.count()).select_from(DBMediaItem).where(DBMediaItem.hash_sha256 == sha256)
-        return (self.db.execute(stmt).scalar_one() or 0) > 0
+        return self.db.connection().execute(_HASH_EXISTS, {"sha256": sha256}).first() is not None
+
+    def exists_hashes(self, hashes: Iterable[str]) -> set[str]:
+        """
+        The subset of `hashes` already stored, in one round trip per 1000 hashes, so a
+        batch of files is checked with a local set lookup instead of exists_hash() each.
+        """
+        pending = list(dict.fromkeys(hashes))
+        conn = self.db.connection()
+        found: set[str] = set()
+        for i in range(0, len(pending), _HASH_BATCH):
+            found.update(conn.execute(_HASHES_PRESENT, {"hashes": pending[i:i + _HASH_BATCH]}).scalars())
+        return found
 
     def iter_media_folders(self) -> Iterable[str]:
-        stmt = select(DBMediaItem.media_folder)
-        for (folder,) in self.db.execute(stmt):
+        for (folder,) in self.db.connection().execute(_MEDIA_FOLDERS):
             yield folder
 
     def count_media_items_by_bucket(self) -> dict[str, int]:
-        stmt = select(DBMediaItem.media_folder, func.count()).group_by(DBMediaItem.media_folder)
-        return {bucket: int(n) for bucket, n in self.db.execute(stmt)}
+        return dict(self.db.connection().execute(COUNT_MEDIA_ITEMS_BY_BUCKET).all())
 
     # -------------------------------------------------------------------------
     # MediaMutationPort
@@ -75,7 +119,12 @@ class SqlAlchemyMediaRepo:
         """
         Build an ORM MediaItem from the domain entity.
         """
-        orm = DBMediaItem(
+        return DBMediaItem(**self._row_values(item))
+
+    @staticmethod
+    def _row_values(item: DomainMediaItem) -> dict[str, Any]:
+        """Column values for a new media_item row built from the domain entity."""
+        return dict(
             media_folder=item.identity.media_folder,
             identity_name=item.identity.identity_name,
             video_ext=item.identity.video_ext,
@@ -107,34 +156,37 @@ class SqlAlchemyMediaRepo:
             favorite=item.favorite or False,
             last_played_at=item.last_played_at,
         )
-        return orm
 
     def create_media_item(self, item: DomainMediaItem) -> DBMediaItem:
-        # Uniqueness check on the triplet
-        mf = item.identity.media_folder
-        nm = item.identity.identity_name
-        vx = item.identity.video_ext
-
-        exists_stmt = (
-            select(func.count())
-            .select_from(DBMediaItem)
-            .where(
-                DBMediaItem.media_folder == mf,
-                DBMediaItem.identity_name == nm,
-                DBMediaItem.video_ext == vx,
-            )
+        # One atomic statement instead of a racy count-then-insert: the triplet's unique
+        # constraint decides, and a conflict returns no row. The INSERT runs now (not at
+        # the caller's next flush); commit stays with the caller.
+        stmt = (
+            pg_insert(DBMediaItem)
+            .values(**self._row_values(item))
+            .on_conflict_do_nothing(constraint="uq_mediaitem_folder_identity_ext")
+            .returning(DBMediaItem)
         )
-        already = self.db.execute(exists_stmt).scalar_one()
-        if already:
+        orm = self.db.scalars(stmt).one_or_none()
+        if orm is None:
+            i = item.identity
             raise ValueError(
-                f"MediaItem already exists for triplet ({mf}/{nm}.{vx})"
+                f"MediaItem already exists for triplet ({i.media_folder}/{i.identity_name}.{i.video_ext})"
             )
-
-        orm = self._import_media_item(item)
-        self.db.add(orm)
-        # caller controls flush/commit
         return orm
 
+    def bulk_create_media_items(self, items: Iterable[DomainMediaItem]) -> list[DBMediaItem]:
+        """
+        Insert many items with one INSERT ... RETURNING (batched by insertmanyvalues) and
+        return the persisted rows, server defaults included, in input order. A triplet
+        that already exists raises IntegrityError for the whole batch.
+        """
+        rows = [self._row_values(i) for i in items]
+        if not rows:
+            return []
+        stmt = insert(DBMediaItem).returning(DBMediaItem, sort_by_parameter_order=True)
+        return list(self.db.scalars(stmt, rows))
+
     def _apply_domain_to_orm(self, orm: DBMediaItem, dom: DomainMediaItem) -> None:
         # Copy over updatable fields (expand as you like)
         orm.title = dom.title
@@ -204,19 +256,13 @@ class SqlAlchemyMediaRepo:
         Delete the media item and make the deletion visible immediately within
         the same Session (tests call Session.get() right after).
         """
-        obj = self.db.get(DBMediaItem, media_item_id)
-        if not obj:
-            return False
-
-        # Mark as deleted, persist to DB, and evict from identity map so .get(...) returns None
-        self.db.delete(obj)
-        self.db.flush()
-        try:
-            self.db.expunge(obj)
-        except Exception:
-            # safe guard; expunge may raise if state already detached
-            pass
-        return True
+        # One DELETE ... RETURNING, no load first: assets, rating and link rows go with it
+        # via their FKs' ON DELETE CASCADE, and the ORM-enabled delete also drops a loaded
+        # instance from the identity map so .get(...) returns None
+        deleted = self.db.execute(
+            sa_delete(DBMediaItem).where(DBMediaItem.id == media_item_id).returning(DBMediaItem.id)
+        ).first()
+        return deleted is not None
 
     # -------------------------------------------------------------------------
     # Internal helpers
@@ -227,16 +273,6 @@ class SqlAlchemyMediaRepo:
         if not item.identity.video_ext:
             raise ValueError("video_ext is required")
 
-    def _enforce_uniques(self, orm: DBMediaItem) -> None:
-        # SQL-level unique constraint exists; this pre-check gives earlier error messaging if desired
-        exists = self.db.query(DBMediaItem.id).filter_by(
-            media_folder=orm.media_folder,
-            identity_name=orm.identity_name,
-            video_ext=orm.video_ext,
-        ).first()
-        if exists:
-            raise ValueError("Media item already exists for this identity triplet")
-
     def _persist_core(self, orm: DBMediaItem) -> DBMediaItem:
         self.db.add(orm)
         # Do not flush/commit here; the API transaction boundary controls commit
@@ -270,16 +306,15 @@ class SqlAlchemyMediaRepo:
         if isinstance(kind, str):
             kind = MediaKind(kind)
 
-        db_row = DBMediaItem(
+        # INSERT ... RETURNING: server defaults come back with the insert itself, no
+        # separate flush + refresh SELECT
+        stmt = insert(DBMediaItem).values(
             kind=kind,
             media_folder=str(media_folder),
             identity_name=str(identity_name),
             video_ext=str(video_ext),
             size_bytes=int(size_bytes),
             hash_sha256=kw.get("hash_sha256"),
-        )
-        self.db.add(db_row)
-        self.db.flush()
-        self.db.refresh(db_row)
-        return self._to_domain(db_row)
+        ).returning(DBMediaItem)
+        return to_domain_media_item(self.db.scalars(stmt).one())
 
@@ -2,7 +2,8 @@ from __future__ import annotations
 from typing import Optional, List
 from uuid import UUID
 
-from sqlalchemy import select, and_, func
+from sqlalchemy import delete, select, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from hexmedia.database.models.person import (
@@ -22,31 +23,29 @@ class SqlAlchemyPeopleRepo:
         return self.db.get(DBPerson, person_id)
 
     def search(self, q: str, limit: int = 25) -> List[DBPerson]:
-        q = (q or "").strip().lower()
+        q = " ".join((q or "").lower().split())
         if not q:
             stmt = select(DBPerson).order_by(DBPerson.display_name.asc()).limit(limit)
         else:
             stmt = (
                 select(DBPerson)
-                .where(func.lower(DBPerson.display_name).like(f"%{q}%"))
+                .where(DBPerson.normalized_name.ilike(f"%{q}%"))
                 .order_by(DBPerson.display_name.asc())
                 .limit(limit)
             )
         return self.db.execute(stmt).scalars().all()
 
-    def create(self, *, display_name: str, normalized_name: str | None = None) -> DBPerson:
-        obj = DBPerson(display_name=display_name, normalized_name=normalized_name)
+    def create(self, *, display_name: str) -> DBPerson:
+        obj = DBPerson(display_name=display_name)
         self.db.add(obj)
         return obj
 
-    def update(self, person_id: UUID, *, display_name: str | None = None, normalized_name: str | None = None) -> DBPerson:
+    def update(self, person_id: UUID, *, display_name: str | None = None) -> DBPerson:
         obj = self.get(person_id)
         if not obj:
             raise ValueError("Person not found")
         if display_name is not None:
             obj.display_name = display_name
-        if normalized_name is not None:
-            obj.normalized_name = normalized_name
         return obj
 
     def delete(self, person_id: UUID) -> None:
@@ -73,29 +72,41 @@ class SqlAlchemyPeopleRepo:
         if not self.db.get(DBPerson, person_id):
             raise ValueError("Person does not exist")
 
-        # Check existing (assumes UniqueConstraint(media_item_id, person_id) on MediaPerson)
-        exists_stmt = select(DBMediaPerson).where(
-            and_(
-                DBMediaPerson.media_item_id == media_item_id,
-                DBMediaPerson.person_id == person_id,
-            )
-        ).limit(1)
-        exists = self.db.execute(exists_stmt).scalars().first()
-        if exists:
-            return exists
-
-        link = DBMediaPerson(media_item_id=media_item_id, person_id=person_id)
-        self.db.add(link)
-        return link
+        # One INSERT ... ON CONFLICT DO NOTHING on the (media_item_id, person_id) PK instead
+        # of SELECT-then-add; an existing pair returns no row and is read by primary key
+        stmt = (
+            pg_insert(DBMediaPerson)
+            .values(media_item_id=media_item_id, person_id=person_id)
+            .on_conflict_do_nothing(index_elements=["media_item_id", "person_id"])
+            .returning(DBMediaPerson)
+        )
+        link = self.db.scalars(stmt).one_or_none()
+        return link or self.db.get(DBMediaPerson, (media_item_id, person_id))
+
+    def link_many(self, *, media_item_id: UUID, person_ids: List[UUID]) -> List[UUID]:
+        """
+        Link several people to one media item in a single multi-row INSERT ... ON CONFLICT
+        DO NOTHING. No existence pre-checks: the foreign keys reject unknown ids
+        (IntegrityError). Returns the person ids that were newly linked.
+        """
+        ids = list(dict.fromkeys(person_ids))
+        if not ids:
+            return []
+        stmt = (
+            pg_insert(DBMediaPerson)
+            .values([{"media_item_id": media_item_id, "person_id": pid} for pid in ids])
+            .on_conflict_do_nothing(index_elements=["media_item_id", "person_id"])
+            .returning(DBMediaPerson.person_id)
+        )
+        return list(self.db.execute(stmt).scalars())
 
     def unlink(self, *, media_item_id: UUID, person_id: UUID) -> None:
-        stmt = select(DBMediaPerson).where(
-            and_(
-                DBMediaPerson.media_item_id == media_item_id,
-                DBMediaPerson.person_id == person_id,
+        # one DELETE; a missing pair simply matches no rows
+        self.db.execute(
+            delete(DBMediaPerson).where(
+                and_(
+                    DBMediaPerson.media_item_id == media_item_id,
+                    DBMediaPerson.person_id == person_id,
+                )
             )
-        ).limit(1)
-        link = self.db.execute(stmt).scalars().first()
-        if not link:
-            return
-        self.db.delete(link)
+        )
@@ -8,6 +8,9 @@ from hexmedia.database.models.taxonomy import Tag, TagGroup, MediaTag
 from hexmedia.common.naming.slugger import slugify
 from hexmedia.domain.enums import Cardinality
 
+# Max ids per IN (...) list: keeps statements and plans small on very large batches
+_IN_CHUNK = 500
+
 
 class TagRepo:
     def __init__(self, db: Session) -> None:
@@ -252,16 +255,16 @@ class TagRepo:
         """
         Map of media_item_id -> [Tag] for a list of items.
         """
-        ids = list(media_item_ids)
-        if not ids:
-            return {}
-        stmt = (
-            select(MediaTag.media_item_id, Tag)
-            .join(Tag, Tag.id == MediaTag.tag_id)
-            .where(MediaTag.media_item_id.in_(ids))
-            .order_by(MediaTag.media_item_id.asc(), Tag.name.asc())
-        )
+        ids = list(dict.fromkeys(media_item_ids))
         out: Dict[UUID, List[Tag]] = {}
-        for mid, tag in self.db.execute(stmt).all():
-            out.setdefault(mid, []).append(tag)
+        # Bounded IN lists: an item's tags all land in the same chunk, so per-item order holds
+        for start in range(0, len(ids), _IN_CHUNK):
+            stmt = (
+                select(MediaTag.media_item_id, Tag)
+                .join(Tag, Tag.id == MediaTag.tag_id)
+                .where(MediaTag.media_item_id.in_(ids[start:start + _IN_CHUNK]))
+                .order_by(MediaTag.media_item_id.asc(), Tag.name.asc())
+            )
+            for mid, tag in self.db.execute(stmt):
+                out.setdefault(mid, []).append(tag)
         return out
\ No newline at end of file
@@ -47,12 +47,15 @@ class MediaIdentity:
         return asdict(self)
 
 
-@dataclass
+@dataclass(frozen=True)
 class MediaItem:
     """
     Core domain entity for a piece of media. Persistence concerns (DB IDs,
     timestamps) are optional and not required for in-memory use.
 
+    Immutable: derive changed copies with dataclasses.replace(). Instances
+    mapped from DB rows are cached and shared (see database.repos._mapping).
+
     Invariants that we keep here:
       - kind is a valid MediaKind
       - identity fields are non-empty
@@ -113,11 +116,11 @@ class MediaItem:
         # Hydrate identity from InitVars if not provided explicitly
         if self.identity is None:
             if media_folder_in and identity_name_in and video_ext_in:
-                self.identity = MediaIdentity(
+                object.__setattr__(self, "identity", MediaIdentity(
                     media_folder=str(media_folder_in),
                     identity_name=str(identity_name_in),
                     video_ext=str(video_ext_in),
-                )
+                ))
             else:
                 raise ValueError(
                     "MediaItem requires identity (MediaIdentity) or the full triplet via "
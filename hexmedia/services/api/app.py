@@ -5,6 +5,8 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
 from hexmedia.common.settings import get_settings
+from hexmedia.database.core.main import SessionLocal
+from hexmedia.database.repos.bucket_counts import install_bucket_count_refresh
 from hexmedia.services.api.routers import media_items, ratings, tags, people, ingest, assets, media_tags, media_people
 
 cfg = get_settings()
@@ -42,6 +44,9 @@ def create_app() -> FastAPI:
 
     app.include_router(media_people.router)
 
+    # Keep the /buckets/count snapshot view current after API writes
+    install_bucket_count_refresh(SessionLocal)
+
     # For images/videos
     app.mount("/media", StaticFiles(directory=str(cfg.media_root), check_dir=False), name="public-media")
     return app
@@ -4,7 +4,7 @@ from typing import Generator
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
-from hexmedia.database.core.main import SessionLocal
+from hexmedia.database.core.main import SessionLocal, SessionLocalRO
 from hexmedia.domain.ports.probe import MediaProbePort
 from hexmedia.services.probe.ffprobe_adapter import FFprobeAdapter  # note the lowercase 'p' in your codebase
 
@@ -22,6 +22,16 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
+def get_db_ro() -> Generator[Session, None, None]:
+    """
+    Read-only endpoints: autocommit Session, so a GET costs no BEGIN/COMMIT round-trips.
+    """
+    db = SessionLocalRO()
+    try:
+        yield db
+    finally:
+        db.close()
+
 def transactional_session(db: Session = Depends(get_db)) -> Generator[Session, None, None]:
     """
     Request-scoped transaction. Any repo/service using this session
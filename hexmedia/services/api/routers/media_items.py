@@ -14,22 +14,15 @@ from hexmedia.services.api.deps import transactional_session
 from hexmedia.services.schemas.media import (
     MediaItemCreate, MediaItemRead, MediaItemPatch,
 )
-from hexmedia.database.repos._mapping import to_domain_media_item
+from hexmedia.database.repos._mapping import (
+    MEDIA_ITEM_COLUMNS, row_to_domain_media_item, to_domain_media_item,
+)
 from hexmedia.services.mappers.media_item import (
     to_domain_from_create, to_read_schema, apply_patch_to_domain
 )
-from hexmedia.database.models.media import (
-    MediaItem as DBMediaItem,
-    MediaAsset as DBMediaAsset,
-    Rating as DBRating
-)
-from hexmedia.database.models.person import (
-    Person as DBPerson,
-    MediaPerson as DBMediaPerson,
-)
+from hexmedia.database.models.media import MediaItem as DBMediaItem
 from hexmedia.database.repos.media_repo import SqlAlchemyMediaRepo
-from hexmedia.database.repos.tag_repo import TagRepo
-from hexmedia.domain.entities.media_item import MediaIdentity
+from hexmedia.domain.entities.media_item import MediaIdentity, MediaItem as DomainMediaItem
 from hexmedia.database.repos.media_query import MediaQueryRepo
 
 from hexmedia.services.schemas import (
@@ -132,9 +125,10 @@ def bucket_counts(
     """
     Return a mapping of { bucket_code: item_count } for all buckets that have items.
     Example: { "000": 42, "001": 17, "abc": 9 }
+    Eventually consistent: counts catch up a few seconds after items are added or moved.
     """
     q = MediaQueryRepo(db)
-    return q.count_media_items_by_bucket()
+    return q.bucket_counts_snapshot()
 
 
 def _asset_full_url(base: str | None, media_folder: str, identity_name: str, rel_path: str) -> str | None:
@@ -145,6 +139,10 @@ def _asset_full_url(base: str | None, media_folder: str, identity_name: str, rel
     return f"{base}/{rel_dir}/{rel_path.lstrip('/')}"
 
 
+def _card(item: DomainMediaItem) -> MediaItemCardRead:
+    return MediaItemCardRead.model_validate(to_read_schema(item).model_dump())
+
+
 @router.get("/by-bucket/{bucket}", response_model=List[MediaItemCardRead])
 def get_media_items_by_bucket(
     bucket: str = Path(..., min_length=3, max_length=3, description="media_folder bucket (e.g., '000')"),
@@ -160,75 +158,27 @@ def get_media_items_by_bucket(
     inc = _parse_include(include)
     q = MediaQueryRepo(db)
 
-    rows = (
-        db.execute(
-            select(DBMediaItem)
+    if not inc:
+        # Core column rows mapped straight to domain items (no ORM instances for the cards)
+        rows = db.execute(
+            select(*MEDIA_ITEM_COLUMNS)
             .where(DBMediaItem.media_folder == bucket)
             .order_by(DBMediaItem.date_created.desc().nullslast(), DBMediaItem.id.desc())
-        )
-        .scalars()
-        .all()
-    )
-    if not rows:
-        return []
-
-    domain_items = [to_domain_media_item(r) for r in rows]
-    base_read_items = [to_read_schema(d) for d in domain_items]
-    items: List[MediaItemCardRead] = [
-        MediaItemCardRead.model_validate(b.model_dump())
-        for b in base_read_items
-    ]
-
-    ids = [it.id for it in items]
-    if not inc or not ids:
-        return items
-
-    # Batch-load relateds based on include flags
-    assets_by_id: dict = {}
-    persons_by_id: dict = {}
-    rating_map: dict = {}
-    tags_by_id: dict = {}
-
-    if "assets" in inc:
-        aset_rows = (
-            db.execute(select(DBMediaAsset).where(DBMediaAsset.media_item_id.in_(ids)))
-            .scalars()
-            .all()
-        )
-        for a in aset_rows:
-            assets_by_id.setdefault(a.media_item_id, []).append(a)
-
-    if "persons" in inc:
-        ppl_rows = db.execute(
-            select(DBMediaPerson.media_item_id, DBPerson)
-            .join(DBPerson, DBPerson.id == DBMediaPerson.person_id)
-            .where(DBMediaPerson.media_item_id.in_(ids))
         ).all()
-        for mid, person in ppl_rows:
-            persons_by_id.setdefault(mid, []).append(person)
-
-    if "ratings" in inc:
-        r_rows = (
-            db.execute(select(DBRating).where(DBRating.media_item_id.in_(ids)))
-            .scalars()
-            .all()
-        )
-        # If you want just the score on the card, keep int; if you prefer DTO, adapt below.
-        rating_map = {r.media_item_id: int(r.score) for r in r_rows}
+        return [_card(row_to_domain_media_item(r)) for r in rows]
 
-    if "tags" in inc:
-        trepo = TagRepo(db)
-        tags_by_id = trepo.batch_tags_for_items(ids)  # Dict[UUID, List[DBTag]]
+    # Includes: relationships requested are eager-loaded onto the ORM rows by the repo
+    db_items = q.list_media_by_bucket(bucket, inc)
+    items: List[MediaItemCardRead] = [_card(to_domain_media_item(r)) for r in db_items]
 
     # Build DTOs, attach URLs and top-level convenience fields
-    cfg = get_settings()
     public_base = cfg.public_media_base_url
 
-    for it in items:
+    for it, row in zip(items, db_items):
         # assets (+ url, + top-level thumb/contact)
         if "assets" in inc:
             aset_dtos: list[MediaAssetRead] = []
-            for a in assets_by_id.get(it.id, []) or []:
+            for a in row.assets:
                 dto = MediaAssetRead.model_validate(a)
                 dto.url = _asset_full_url(
                     public_base,
@@ -248,16 +198,15 @@ def get_media_items_by_bucket(
 
         # persons
         if "persons" in inc:
-            it.persons = [PersonRead.model_validate(p) for p in (persons_by_id.get(it.id) or [])]
+            it.persons = [PersonRead.model_validate(p) for p in row.people]
 
         # ratings (keep as int per MediaItemCardRead schema)
         if "ratings" in inc:
-            score = rating_map.get(it.id)
-            it.rating = int(score) if score is not None else None
+            it.rating = row.rating.score if row.rating is not None else None  # INTEGER column: already int
 
         # tags
         if "tags" in inc:
-            it.tags = [TagRead.model_validate(t) for t in (tags_by_id.get(it.id) or [])]
+            it.tags = [TagRead.model_validate(t) for t in sorted(row.tags, key=lambda t: t.name)]
 
     return items
 
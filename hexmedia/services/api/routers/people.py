@@ -6,11 +6,13 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import literal, select
+from sqlalchemy.orm import Session, selectinload
 
 from hexmedia.common.settings import get_settings
-from hexmedia.database.models.person import Person as DBPerson, PersonAlias as DBAlias, PersonAliasLink as DBAliasLink
+from hexmedia.database.models.person import (
+    Person as DBPerson, PersonAlias as DBAlias, PersonAliasLink as DBAliasLink, normalized_expr,
+)
 from hexmedia.services.api.deps import transactional_session
 from hexmedia.services.schemas.people import (
     PersonCreate, PersonUpdate, PersonRead,
@@ -24,12 +26,21 @@ router = APIRouter(prefix=f"{cfg.api.prefix}/people", tags=["people"])
 # ---- helpers ----
 
 def _normalize(s: str) -> str:
-    # best-effort normalization: lowercase + collapse whitespace
+    # lowercase + collapse whitespace, approximating the generated normalized columns for
+    # search terms; exact-match lookups use normalized_expr() so Postgres normalizes both sides
     return " ".join((s or "").lower().split())
 
 
-def _person_or_404(db: Session, person_id: UUID) -> DBPerson:
-    obj = db.get(DBPerson, person_id)
+def _person_or_404(db: Session, person_id: UUID, *, with_aliases: bool = False) -> DBPerson:
+    if with_aliases:
+        # populate_existing: also reloads server-generated columns on an object already in
+        # the identity map (e.g. right after a flush)
+        obj = db.get(
+            DBPerson, person_id,
+            options=[selectinload(DBPerson.aliases)], populate_existing=True,
+        )
+    else:
+        obj = db.get(DBPerson, person_id)
     if not obj:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Person not found")
     return obj
@@ -47,15 +58,14 @@ def search_people(
     if not qn:
         stmt = select(DBPerson).order_by(DBPerson.display_name.asc()).limit(limit)
     else:
-        # trigram-friendly LIKE against display_name (normalized index also exists)
-        from sqlalchemy import func
+        # substring ILIKE on normalized_name (served by ix_people_normalized_name_trgm)
         stmt = (
             select(DBPerson)
-            .where(func.lower(DBPerson.display_name).like(f"%{qn}%"))
+            .where(DBPerson.normalized_name.ilike(f"%{qn}%"))
             .order_by(DBPerson.display_name.asc())
             .limit(limit)
         )
-    rows = db.execute(stmt).scalars().all()
+    rows = db.execute(stmt.options(selectinload(DBPerson.aliases))).scalars().all()
     return [PersonRead.model_validate(p) for p in rows]
 
 
@@ -66,13 +76,12 @@ def create_person(
 ) -> PersonRead:
     obj = DBPerson(
         display_name=payload.display_name,
-        normalized_name=payload.normalized_name or _normalize(payload.display_name),
         notes=payload.notes,
         avatar_asset_id=payload.avatar_asset_id,
     )
     db.add(obj)
     db.flush()  # ensure id
-    db.refresh(obj)
+    obj = _person_or_404(db, obj.id, with_aliases=True)
     return PersonRead.model_validate(obj)
 
 
@@ -81,7 +90,7 @@ def get_person(
     person_id: UUID = Path(...),
     db: Session = Depends(transactional_session),
 ) -> PersonRead:
-    obj = _person_or_404(db, person_id)
+    obj = _person_or_404(db, person_id, with_aliases=True)
     return PersonRead.model_validate(obj)
 
 
@@ -94,13 +103,7 @@ def update_person(
     obj = _person_or_404(db, person_id)
 
     if payload.display_name is not None:
-        obj.display_name = payload.display_name
-        # if normalized_name omitted, keep existing; caller can explicitly set it
-        if payload.normalized_name is None:
-            obj.normalized_name = _normalize(payload.display_name)
-
-    if payload.normalized_name is not None:
-        obj.normalized_name = payload.normalized_name
+        obj.display_name = payload.display_name  # normalized_name follows (generated column)
 
     if payload.notes is not None:
         obj.notes = payload.notes
@@ -109,7 +112,7 @@ def update_person(
         obj.avatar_asset_id = payload.avatar_asset_id
 
     db.flush()
-    db.refresh(obj)
+    obj = _person_or_404(db, person_id, with_aliases=True)
     return PersonRead.model_validate(obj)
 
 
@@ -131,8 +134,7 @@ def list_person_aliases(
     person_id: UUID,
     db: Session = Depends(transactional_session),
 ) -> List[PersonAliasRead]:
-    p = _person_or_404(db, person_id)
-    # relationship is eager-selectin; model_validate handles it
+    p = _person_or_404(db, person_id, with_aliases=True)
     return [PersonAliasRead.model_validate(a) for a in (p.aliases or [])]
 
 
@@ -143,16 +145,16 @@ def add_alias_to_person(
     db: Session = Depends(transactional_session),
 ) -> PersonAliasRead:
     p = _person_or_404(db, person_id)
-    norm = _normalize(payload.alias)
+    alias = payload.alias.strip()
 
-    # find or create global alias
+    # find or create global alias; normalized in SQL exactly as the generated column is
     from sqlalchemy import select
     existing = db.execute(
-        select(DBAlias).where(DBAlias.alias_normalized == norm).limit(1)
+        select(DBAlias).where(DBAlias.alias_normalized == normalized_expr(literal(alias))).limit(1)
     ).scalars().first()
 
     if existing is None:
-        existing = DBAlias(alias=payload.alias.strip(), alias_normalized=norm, notes=payload.notes)
+        existing = DBAlias(alias=alias, notes=payload.notes)
         db.add(existing)
         db.flush()
 
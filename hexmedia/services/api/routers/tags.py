@@ -19,7 +19,7 @@ from hexmedia.services.schemas import (
     TagGroupMove,
     TagGroupNode
 )
-from hexmedia.services.api.deps import get_db, transactional_session
+from hexmedia.services.api.deps import get_db_ro, transactional_session
 from hexmedia.common.settings import get_settings
 
 cfg = get_settings()
@@ -29,7 +29,7 @@ def _to_out(t: Tag) -> TagRead:
     return TagRead.model_validate(t)
 
 @router.get("/groups", response_model=List[TagGroupNode])
-def list_tag_groups_alias(db: Session = Depends(get_db)):
+def list_tag_groups_alias(db: Session = Depends(get_db_ro)):
     return tag_group_tree(db)
 
 def _resolve_ids_from_paths(db: Session, payload: TagCreate | TagUpdate):
@@ -68,7 +68,7 @@ def create_tag(payload: TagCreate, db: Session = Depends(transactional_session))
     return _to_out(obj)
 
 @router.get("/{tag_id}", response_model=TagRead)
-def get_tag(tag_id: UUID, db: Session = Depends(get_db)) -> TagRead:
+def get_tag(tag_id: UUID, db: Session = Depends(get_db_ro)) -> TagRead:
     obj = db.get(Tag, tag_id)
     if not obj:
         raise HTTPException(status_code=HTTPStatus.NOT_FOUND, detail="Tag not found")
@@ -80,7 +80,7 @@ def list_tags(
     group_id: Optional[UUID] = Query(None),
     group_path: Optional[str] = Query(None),
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_db_ro),
 ) -> List[TagRead]:
     stmt = select(Tag)
     if q:
@@ -112,7 +112,7 @@ def delete_tag(tag_id: UUID, db: Session = Depends(transactional_session)) -> No
     # transactional_session will commit
 
 @router.get("/tag-groups/tree", response_model=List[TagGroupNode])
-def tag_group_tree(db: Session = Depends(get_db)) -> List[TagGroupNode]:
+def tag_group_tree(db: Session = Depends(get_db_ro)) -> List[TagGroupNode]:
     repo = TagRepo(db)
     rows = repo.list_group_tree()
     by_id = {g.id: TagGroupNode.model_validate(g) for g in rows}
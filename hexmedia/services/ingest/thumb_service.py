@@ -1,12 +1,14 @@
 # hexmedia/services/ingest/thumb_service.py
 from __future__ import annotations
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from concurrent.futures import as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.orm import Session
 
+from hexmedia.common.concurrency.thread_manager import get_thread_manager
 from hexmedia.common.settings import get_settings
 from hexmedia.database.repos.media_asset_repo import SqlAlchemyMediaAssetRepo
 from hexmedia.database.repos.media_query import MediaQueryRepo
@@ -73,37 +75,41 @@ class ThumbService:
         max_workers = min(workers or 1, self.cfg.max_thumb_workers)
         rep.scanned = len(cands)
 
-        # 3) Fan out → aggregate results
-        with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = [
-                pool.submit(tw.process_one, mid, rel_dir, fname)
-                for (mid, rel_dir, fname) in cands
-            ]
-            for fut in as_completed(futures):
-                try:
-                    r = fut.result()
-                except Exception as e:
-                    rep.errors += 1
-                    rep.error_details.append(str(e))
-                    continue
+        # 3) Fan out → aggregate results. The shared, process-wide pool is sized by the
+        # config cap (not shut down here); this run keeps at most max_workers in flight.
+        pool = get_thread_manager("thumbs", self.cfg.max_thumb_workers, log_exceptions=False)
+        in_flight = threading.BoundedSemaphore(max_workers)
+        futures = []
+        for (mid, rel_dir, fname) in cands:
+            in_flight.acquire()
+            fut = pool.submit(tw.process_one, mid, rel_dir, fname)
+            fut.add_done_callback(lambda _f: in_flight.release())
+            futures.append(fut)
+        for fut in as_completed(futures):
+            try:
+                r = fut.result()
+            except Exception as e:
+                rep.errors += 1
+                rep.error_details.append(str(e))
+                continue
 
-                # tolerate workers returning None or non-dicts
-                if not isinstance(r, dict):
-                    continue
+            # tolerate workers returning None or non-dicts
+            if not isinstance(r, dict):
+                continue
 
-                # aggregate safely with defaults
-                rep.generated += int(r.get("generated", 0) or 0)
-                rep.updated  += int(r.get("updated", 0) or 0)
-                rep.skipped  += int(r.get("skipped", 0) or 0)
-                rep.errors   += int(r.get("errors", 0) or 0)
+            # aggregate safely with defaults
+            rep.generated += int(r.get("generated", 0) or 0)
+            rep.updated  += int(r.get("updated", 0) or 0)
+            rep.skipped  += int(r.get("skipped", 0) or 0)
+            rep.errors   += int(r.get("errors", 0) or 0)
 
-                # optional error fields from workers
-                err = r.get("error") or r.get("error_detail") or r.get("error_details")
-                if err:
-                    if isinstance(err, (list, tuple)):
-                        rep.error_details.extend(map(str, err))
-                    else:
-                        rep.error_details.append(str(err))
+            # optional error fields from workers
+            err = r.get("error") or r.get("error_detail") or r.get("error_details")
+            if err:
+                if isinstance(err, (list, tuple)):
+                    rep.error_details.extend(map(str, err))
+                else:
+                    rep.error_details.append(str(err))
 
         rep.stop()
         return rep
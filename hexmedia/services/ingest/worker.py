@@ -109,19 +109,19 @@ class IngestWorker:
                 identity=midentity,
                 size_bytes=size_bytes,
                 hash_sha256=sha256,
+                # Enrich from probe
+                duration_sec=probe_res.duration_sec,
+                width=probe_res.width,
+                height=probe_res.height,
+                fps=probe_res.fps,
+                bitrate=probe_res.bitrate,
+                codec_video=probe_res.codec_video,
+                codec_audio=probe_res.codec_audio,
+                container=probe_res.container,
+                aspect_ratio=probe_res.aspect_ratio,
+                language=probe_res.language,
+                has_subtitles=probe_res.has_subtitles,
             )
-            # Enrich from probe
-            mi.duration_sec = probe_res.duration_sec
-            mi.width = probe_res.width
-            mi.height = probe_res.height
-            mi.fps = probe_res.fps
-            mi.bitrate = probe_res.bitrate
-            mi.codec_video = probe_res.codec_video
-            mi.codec_audio = probe_res.codec_audio
-            mi.container = probe_res.container
-            mi.aspect_ratio = probe_res.aspect_ratio
-            mi.language = probe_res.language
-            mi.has_subtitles = probe_res.has_subtitles
 
             # -------------------------
             # 3) DB INSERT + 4) MOVE (inside a SAVEPOINT)
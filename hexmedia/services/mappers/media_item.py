@@ -1,6 +1,8 @@
 # hexmedia/services/mappers/media_item_mapper.py
 from __future__ import annotations
 
+from dataclasses import replace
+
 from hexmedia.domain.entities.media_item import MediaItem, MediaIdentity
 from hexmedia.services.schemas.media import (
     MediaItemCreate, MediaItemPatch, MediaItemRead,
@@ -43,35 +45,20 @@ def to_domain_from_create(s: MediaItemCreate) -> MediaItem:
         data_origin=s.data_origin,
     )
 
-def apply_patch_to_domain(item: MediaItem, p: MediaItemPatch) -> MediaItem:
-    if p.kind is not None:
-        item.kind = p.kind
-
-    if p.size_bytes is not None: item.size_bytes = p.size_bytes
-    if p.hash_sha256 is not None: item.hash_sha256 = p.hash_sha256
-    if p.phash is not None: item.phash = p.phash
-
-    if p.duration_sec is not None: item.duration_sec = p.duration_sec
-    if p.width is not None: item.width = p.width
-    if p.height is not None: item.height = p.height
-    if p.fps is not None: item.fps = p.fps
-    if p.bitrate is not None: item.bitrate = p.bitrate
-    if p.codec_video is not None: item.codec_video = p.codec_video
-    if p.codec_audio is not None: item.codec_audio = p.codec_audio
-    if p.container is not None: item.container = p.container
-    if p.aspect_ratio is not None: item.aspect_ratio = p.aspect_ratio
-    if p.language is not None: item.language = p.language
-    if p.has_subtitles is not None: item.has_subtitles = p.has_subtitles
-
-    if p.title is not None: item.title = p.title
-    if p.release_year is not None: item.release_year = p.release_year
-    if p.source is not None: item.source = p.source
-    if p.watched is not None: item.watched = p.watched
-    if p.favorite is not None: item.favorite = p.favorite
-    if p.last_played_at is not None: item.last_played_at = p.last_played_at
+# MediaItemPatch fields copied onto the domain item when set (not None)
+_PATCHABLE = (
+    "kind",
+    "size_bytes", "hash_sha256", "phash",
+    "duration_sec", "width", "height", "fps", "bitrate", "codec_video", "codec_audio",
+    "container", "aspect_ratio", "language", "has_subtitles",
+    "title", "release_year", "source", "watched", "favorite", "last_played_at",
+    "data_origin",
+)
 
-    if p.data_origin is not None: item.data_origin = p.data_origin
-    return item
+def apply_patch_to_domain(item: MediaItem, p: MediaItemPatch) -> MediaItem:
+    # MediaItem is frozen: return a patched copy
+    changes = {f: v for f in _PATCHABLE if (v := getattr(p, f)) is not None}
+    return replace(item, **changes) if changes else item
 
 def to_read_schema(item: MediaItem) -> MediaItemRead:
     return MediaItemRead(
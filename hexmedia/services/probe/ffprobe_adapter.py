@@ -8,11 +8,7 @@ from pathlib import Path
 from typing import Optional
 
 from hexmedia.common.logging import get_logger
-from hexmedia.common.probe.ffprobe_helpers import (
-    build_ffprobe_cmd,
-    run_ffprobe,
-    parse_ffprobe
-)
+from hexmedia.common.probe.ffprobe_helpers import probe_cached
 
 from hexmedia.domain.dataclasses.probe import ProbeResult
 from hexmedia.domain.ports.probe import MediaProbePort
@@ -31,14 +27,14 @@ class FFprobeError(RuntimeError):
 class FFprobeAdapter:
     """
     Infrastructure adapter implementing MediaProbePort using `ffprobe`.
+    Probes in-process through libav (PyAV) when it is installed and falls back
+    to the ffprobe subprocess when it isn't, or when libav can't open the file.
+    Results are cached by (path, mtime, size), so re-scans only probe changed files.
     Safe for use from ThreadManager (I/O-bound).    """
 
     @staticmethod
     def probe(input_path: str) -> ProbeResult:
-        cmd = build_ffprobe_cmd(input_path)
-        data = run_ffprobe(cmd)
-        parsed = parse_ffprobe(data)
-        return ProbeResult(**parsed)
+        return ProbeResult(**probe_cached(input_path))
 
     #     # ---- Port API -------------------------------------------------------------
 #     def probe(self, path: Path) -> ProbeResult:
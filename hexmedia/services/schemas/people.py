@@ -29,7 +29,6 @@ class PersonAliasRead(BaseModel):
 
 class PersonBase(BaseModel):
     display_name: str = Field(..., min_length=1, max_length=255)
-    normalized_name: Optional[str] = Field(default=None, max_length=255)
     notes: Optional[str] = None
     avatar_asset_id: Optional[UUID] = None
 
@@ -40,7 +39,6 @@ class PersonCreate(PersonBase):
 
 class PersonUpdate(BaseModel):
     display_name: Optional[str] = Field(default=None, max_length=255)
-    normalized_name: Optional[str] = Field(default=None, max_length=255)
     notes: Optional[str] = None
     avatar_asset_id: Optional[UUID] = None
 
@@ -49,6 +47,7 @@ class PersonRead(PersonBase):
     model_config = ConfigDict(from_attributes=True)
 
     id: UUID
+    normalized_name: Optional[str] = None  # generated by the DB from display_name
     aliases: List[PersonAliasRead] = []
 
 
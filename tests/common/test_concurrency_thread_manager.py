@@ -0,0 +1,162 @@
+import threading
+import time
+
+import pytest
+
+from hexmedia.common.concurrency.thread_manager import ThreadManager, get_thread_manager
+
+
+def _boom(x):
+    raise ValueError(f"bad {x}")
+
+
+@pytest.mark.threaded
+def test_stats_count_completed_and_failed():
+    with ThreadManager(name="t", max_workers=4, log_exceptions=False) as tm:
+        ok = [tm.submit(lambda x: x * 2, i) for i in range(20)]
+        bad = [tm.submit(_boom, i) for i in range(5)]
+        assert [f.result() for f in ok] == [i * 2 for i in range(20)]
+        for f in bad:
+            with pytest.raises(ValueError):
+                f.result()
+        # accounting happens on the worker before the future resolves
+        st = tm.stats()
+        assert st.tasks_submitted == 25
+        assert st.tasks_completed == 20
+        assert st.tasks_failed == 5
+        assert st.in_flight == 0
+
+
+def test_stats_snapshot_is_repeatable():
+    with ThreadManager(name="t", max_workers=2) as tm:
+        tm.submit(lambda: 1).result()
+        tm.shutdown(wait=True)
+        first = tm.stats()
+        second = tm.stats()
+        assert first.tasks_submitted == second.tasks_submitted == 1
+        assert first.tasks_completed == second.tasks_completed == 1
+
+
+@pytest.mark.threaded
+def test_imap_unordered_yields_every_result_once():
+    with ThreadManager(name="t", max_workers=3) as tm:
+        out = list(tm.imap_unordered(lambda x: x + 1, range(200), prefetch=2))
+    assert sorted(out) == list(range(1, 201))
+
+
+def test_imap_unordered_empty_iterable():
+    with ThreadManager(name="t", max_workers=2) as tm:
+        assert list(tm.imap_unordered(lambda x: x, [])) == []
+
+
+@pytest.mark.threaded
+def test_submit_blocks_while_work_queue_is_full():
+    gate = threading.Event()
+    with ThreadManager(name="t", max_workers=1, max_queue=1) as tm:
+        first = tm.submit(gate.wait)       # occupies the only worker
+        second = tm.submit(lambda: "queued")  # fills the pending queue
+
+        submitted = threading.Event()
+
+        def _producer():
+            tm.submit(lambda: "late")
+            submitted.set()
+
+        t = threading.Thread(target=_producer)
+        t.start()
+        assert not submitted.wait(timeout=0.2)  # backpressure: no room yet
+
+        gate.set()
+        t.join(timeout=5)
+        assert submitted.is_set()
+        assert first.result() is True
+        assert second.result() == "queued"
+
+
+@pytest.mark.threaded
+def test_map_preserves_input_order():
+    def _slow_for_small(x):
+        time.sleep(0.001 * (10 - x % 10))
+        return x * x
+
+    with ThreadManager(name="t", max_workers=4) as tm:
+        assert tm.map(_slow_for_small, range(50)) == [x * x for x in range(50)]
+        assert sorted(tm.map(_slow_for_small, range(50), preserve_order=False)) == [x * x for x in range(50)]
+
+
+def test_get_thread_manager_reuses_pool_per_role():
+    a = get_thread_manager("test-role", 2)
+    assert get_thread_manager("test-role", 2) is a
+    # keyed by role only: a different sizing ask must not spawn (and leak) another pool
+    assert get_thread_manager("test-role", 3) is a
+    assert a.submit(lambda: 7).result() == 7
+
+
+def test_stats_uptime_is_monotonic_and_non_negative():
+    with ThreadManager(name="t", max_workers=1) as tm:
+        a = tm.stats().uptime_sec
+        b = tm.stats().uptime_sec
+    assert 0 <= a <= b
+
+
+@pytest.mark.threaded
+def test_idle_workers_steal_backlog_behind_a_long_task():
+    gate = threading.Event()
+    with ThreadManager(name="t", max_workers=2) as tm:
+        blocker = tm.submit(gate.wait)
+        # round-robin puts half of these behind the blocker on its worker's queue
+        quick = [tm.submit(lambda i=i: i) for i in range(10)]
+        assert [f.result(timeout=5) for f in quick] == list(range(10))
+        assert not blocker.done()
+        gate.set()
+        assert blocker.result(timeout=5) is True
+
+
+def test_shutdown_cancel_futures_cancels_pending():
+    gate = threading.Event()
+    tm = ThreadManager(name="t", max_workers=1)
+    running = tm.submit(gate.wait)
+    pending = [tm.submit(lambda: 1) for _ in range(5)]
+    time.sleep(0.05)
+    tm.shutdown(wait=False, cancel_futures=True)
+    gate.set()
+    assert running.result(timeout=5) is True
+    assert all(f.cancelled() for f in pending)
+
+
+@pytest.mark.threaded
+def test_parked_workers_are_woken_to_steal():
+    gate = threading.Event()
+    with ThreadManager(name="t", max_workers=2) as tm:
+        assert tm.submit(lambda: 0).result(timeout=5) == 0
+        time.sleep(0.05)  # both workers now parked on their own empty queue
+        blocker = tm.submit(gate.wait)
+        quick = [tm.submit(lambda i=i: i) for i in range(10)]
+        assert [f.result(timeout=5) for f in quick] == list(range(10))
+        assert not blocker.done()
+        gate.set()
+        assert blocker.result(timeout=5) is True
+
+
+@pytest.mark.threaded
+def test_imap_unordered_window_shrinks_to_lo_when_caller_is_slow():
+    # 4 workers x 20 ms tasks deliver a result every ~5 ms; the caller takes 10 ms per
+    # result, so it is the bottleneck and the adaptive window should settle at its floor
+    workers = 4
+    pulled = 0
+
+    def _items():
+        nonlocal pulled
+        for i in range(40):
+            pulled += 1
+            yield i
+
+    peaks = []
+    with ThreadManager(name="t", max_workers=workers) as tm:
+        for n, _ in enumerate(tm.imap_unordered(lambda x: time.sleep(0.02), _items())):
+            if pulled < 40:  # not yet draining the tail
+                peaks.append(pulled - n - 1)  # still in flight when this result is handed out
+            time.sleep(0.01)
+    # starts at workers + 2*workers; the floor is workers + lo (lo == workers)
+    assert peaks[0] == 3 * workers
+    assert peaks[-5:] == [2 * workers] * 5
@@ -0,0 +1,18 @@
+import time
+
+from hexmedia.common.ids import _uuid7_py, uuid7
+
+
+def test_uuid7_version_and_variant():
+    for gen in (uuid7, _uuid7_py):
+        u = gen()
+        assert u.version == 7
+        assert u.variant == "specified in RFC 4122"
+
+
+def test_uuid7_is_time_ordered_across_milliseconds():
+    a = _uuid7_py()
+    time.sleep(0.002)
+    b = _uuid7_py()
+    assert a < b
+    assert abs((a.int >> 80) - time.time_ns() // 1_000_000) < 1000
@@ -13,3 +13,10 @@ def test_random_slug_varies():
     # Not a cryptographic test; just ensure outputs usually differ.
     slugs = {random_slug(8) for _ in range(50)}
     assert len(slugs) > 40
+
+
+def test_random_slug_custom_alphabet():
+    slug = random_slug(64, alphabet="xyz")
+    assert len(slug) == 64
+    assert set(slug) <= set("xyz")
+    assert random_slug(0) == ""
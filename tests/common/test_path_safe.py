@@ -32,3 +32,28 @@ def test_ensure_inside_ok(tmp_path):
 def test_ensure_inside_reject(tmp_path):
     with pytest.raises(ValueError):
         ensure_inside("/tmp", tmp_path)
+
+
+def test_safe_join_rejects_sibling_with_root_prefix(tmp_path):
+    root = tmp_path / "media"
+    root.mkdir()
+    with pytest.raises(ValueError):
+        safe_join(root, "../media-other/x.txt")
+
+
+def test_safe_join_lexical_mode(tmp_path):
+    out = safe_join(tmp_path, "a/./b/../c.txt", follow_symlinks=False)
+    assert out == resolve_root(tmp_path) / "a" / "c.txt"
+    with pytest.raises(ValueError):
+        safe_join(tmp_path, "a/../../outside.txt", follow_symlinks=False)
+
+
+def test_resolve_root_relative_follows_cwd(tmp_path, monkeypatch):
+    a, b = tmp_path / "a", tmp_path / "b"
+    (a / "media").mkdir(parents=True)
+    (b / "media").mkdir(parents=True)
+    monkeypatch.chdir(a)
+    assert resolve_root("media") == (a / "media").resolve()
+    monkeypatch.chdir(b)
+    assert resolve_root("media") == (b / "media").resolve()
+    assert safe_join("media", "x.txt") == (b / "media" / "x.txt").resolve()
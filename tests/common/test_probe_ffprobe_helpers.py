@@ -1,5 +1,14 @@
+import sys
 from pathlib import Path
-from hexmedia.common.probe.ffprobe_helpers import build_ffprobe_cmd, parse_ffprobe
+
+import pytest
+
+from hexmedia.common.probe.ffprobe_helpers import (
+    build_ffprobe_cmd,
+    parse_ffprobe,
+    probe_via_libav,
+    run_ffprobe,
+)
 
 
 def test_build_ffprobe_cmd_uses_json_flags(tmp_path):
@@ -46,3 +55,134 @@ def test_parse_ffprobe_minimal():
     assert out["aspect_ratio"] in ("16:9", "")  # allow empty fallback
     assert out["language"] in ("eng", None)
     assert out["has_subtitles"] in (False, True)
+
+
+def test_run_ffprobe_parses_stdout_json():
+    cmd = [sys.executable, "-c", 'print(\'{"format": {"duration": "1.5"}, "streams": []}\')']
+    data = run_ffprobe(cmd)
+    assert data == {"format": {"duration": "1.5"}, "streams": []}
+
+
+def test_run_ffprobe_empty_stdout_is_empty_dict():
+    assert run_ffprobe([sys.executable, "-c", "pass"]) == {}
+
+
+def test_run_ffprobe_invalid_json_raises():
+    with pytest.raises(RuntimeError):
+        run_ffprobe([sys.executable, "-c", "print('not json')"])
+
+
+def test_probe_via_libav_matches_parse_ffprobe_keys(tmp_path):
+    av = pytest.importorskip("av")
+    f = tmp_path / "clip.mp4"
+    with av.open(str(f), "w") as c:
+        s = c.add_stream("mpeg4", rate=25)
+        s.width, s.height, s.pix_fmt = 320, 240, "yuv420p"
+        for i in range(50):
+            frame = av.VideoFrame(320, 240, "yuv420p")
+            frame.pts = i
+            for pkt in s.encode(frame):
+                c.mux(pkt)
+        for pkt in s.encode():
+            c.mux(pkt)
+
+    out = probe_via_libav(f)
+    assert set(out) == set(parse_ffprobe({}))
+    assert out["codec_video"] == "mpeg4"
+    assert out["codec_audio"] is None
+    assert (out["width"], out["height"]) == (320, 240)
+    assert out["fps"] == 25.0
+    assert out["duration_sec"] == 2
+    assert out["has_subtitles"] is False
+
+
+def test_run_ffprobe_nonzero_exit_raises():
+    import subprocess
+
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('nope'); sys.exit(2)"]
+    with pytest.raises(subprocess.CalledProcessError) as ei:
+        run_ffprobe(cmd)
+    assert ei.value.returncode == 2
+    assert ei.value.stderr == b"nope"
+
+
+def test_probe_cached_skips_unchanged_files(tmp_path, monkeypatch):
+    import os
+
+    from hexmedia.common.probe import ffprobe_helpers as fh
+
+    calls = []
+
+    def _fake_probe(p):
+        calls.append(p)
+        return {"duration_sec": len(calls)}
+
+    monkeypatch.setattr(fh, "probe_file", _fake_probe)
+    cache = fh.ProbeCache(tmp_path / "probe.sqlite")
+    f = tmp_path / "v.mp4"
+    f.write_bytes(b"abc")
+
+    assert fh.probe_cached(f, cache) == {"duration_sec": 1}
+    assert fh.probe_cached(f, cache) == {"duration_sec": 1}
+    assert len(calls) == 1
+
+    f.write_bytes(b"abcd")  # size change -> new key
+    os.utime(f, ns=(0, 12345))
+    assert fh.probe_cached(f, cache) == {"duration_sec": 2}
+    assert len(calls) == 2
+
+
+def test_probe_cache_evicts_oldest_past_max_entries(tmp_path):
+    from hexmedia.common.probe.ffprobe_helpers import ProbeCache
+
+    cache = ProbeCache(tmp_path / "probe.sqlite", max_entries=3)
+    for i in range(5):
+        cache.put((f"/m/{i}.mp4", 1, 1), {"i": i})
+    cache.put(("/m/2.mp4", 1, 1), {"i": 22})  # re-put refreshes its age
+    cache.put(("/m/5.mp4", 1, 1), {"i": 5})
+
+    assert [cache.get((f"/m/{i}.mp4", 1, 1)) for i in range(6)] == [
+        None, None, {"i": 22}, None, {"i": 4}, {"i": 5},
+    ]
+
+
+def test_run_ffprobe_parsed_matches_buffered_parse():
+    import json
+
+    from hexmedia.common.probe.ffprobe_helpers import run_ffprobe_parsed
+
+    doc = {
+        "streams": [
+            {"codec_type": "data", "codec_name": "bin_data"},
+            {"codec_type": "audio", "codec_name": "aac", "tags": {"language": "eng"}},
+            {
+                "codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+                "r_frame_rate": "30000/1001", "display_aspect_ratio": "16:9",
+                "side_data_list": [{"codec_name": "ignored"}],
+                "tags": {"language": "jpn"},
+            },
+            {"codec_type": "video", "codec_name": "mjpeg", "width": 300, "height": 300},
+            {"codec_type": "subtitle", "codec_name": "subrip"},
+        ],
+        "chapters": [{"id": i, "tags": {"title": f"c{i}"}} for i in range(50)],
+        "format": {"duration": "61.5", "format_name": "matroska,webm", "bit_rate": "4000000",
+                   "tags": {"language": "eng"}},
+    }
+    cmd = [sys.executable, "-c", f"print({json.dumps(json.dumps(doc))})"]
+    assert run_ffprobe_parsed(cmd) == parse_ffprobe(doc)
+
+
+@pytest.mark.parametrize("fn_name", ["run_ffprobe", "run_ffprobe_parsed"])
+def test_run_ffprobe_survives_stderr_larger_than_a_pipe(fn_name):
+    import threading
+
+    from hexmedia.common.probe import ffprobe_helpers as fh
+
+    # 4 MiB of stderr before any stdout: more than a (grown) pipe buffer holds
+    cmd = [sys.executable, "-c", "import sys; sys.stderr.write('x' * (4 << 20)); print('{}')"]
+    result = []
+    t = threading.Thread(target=lambda: result.append(getattr(fh, fn_name)(cmd)), daemon=True)
+    t.start()
+    t.join(timeout=30)
+    assert not t.is_alive(), "ffprobe runner deadlocked on a full stderr pipe"
+    assert result and isinstance(result[0], dict)
@@ -1,8 +1,10 @@
 # tests/database/conftest.py
 from __future__ import annotations
 
+from contextlib import contextmanager
+
 import pytest
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.orm import Session
 
 APP_SCHEMA = "hexmedia"
@@ -26,3 +28,26 @@ def db(db_engine) -> Session:
         session.close()
         trans.rollback()
         connection.close()
+
+
+@pytest.fixture()
+def sql_statements(db):
+    """
+    Context manager that records the SQL emitted on the test session's connection:
+
+        with sql_statements() as statements:
+            db.get(Tag, tag_id)
+        assert len(statements) == 1
+    """
+    @contextmanager
+    def _capture():
+        statements: list[str] = []
+        conn = db.connection()
+        listener = lambda _conn, _cursor, statement, *_: statements.append(statement)  # noqa: E731
+        event.listen(conn, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(conn, "before_cursor_execute", listener)
+
+    return _capture
@@ -1,5 +1,7 @@
 # tests/database/test_person_models.py
-from sqlalchemy.exc import IntegrityError
+import pytest
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.orm import selectinload
 
 from hexmedia.database.models.media import MediaItem
 from hexmedia.database.models.person import (
@@ -22,24 +24,28 @@ def _mk_media(session, folder="000", name="abcd1234efgh", ext="mp4"):
 
 
 def test_person_alias_many_to_many(db):
-    p = Person(display_name="Jane Doe", normalized_name="jane doe")
-    a1 = PersonAlias(alias="JD", alias_normalized="jd")
-    a2 = PersonAlias(alias="Janie", alias_normalized="janie")
+    p = Person(display_name="  Jane   Doe ")
+    a1 = PersonAlias(alias="JD")
+    a2 = PersonAlias(alias="Janie")
 
     db.add_all([p, a1, a2])
     db.flush()
 
+    # normalized columns are generated by Postgres
+    assert p.normalized_name == "jane doe"
+    assert (a1.alias_normalized, a2.alias_normalized) == ("jd", "janie")
+
     db.add_all([
         PersonAliasLink(person_id=p.id, alias_id=a1.id),
         PersonAliasLink(person_id=p.id, alias_id=a2.id),
     ])
     db.flush()
-    db.refresh(p)
+    db.refresh(p, ["aliases"])  # aliases are never loaded implicitly
 
     assert {al.alias for al in p.aliases} == {"JD", "Janie"}
 
     # Global uniqueness of alias_normalized
-    dup = PersonAlias(alias="JD2", alias_normalized="jd")
+    dup = PersonAlias(alias="jd")
     db.add(dup)
     try:
         db.flush()
@@ -48,6 +54,28 @@ def test_person_alias_many_to_many(db):
         db.rollback()
 
 
+def test_person_load_does_not_touch_aliases(db, sql_statements):
+    p = Person(display_name="Quiet Loader")
+    p.aliases.append(PersonAlias(alias="QL"))
+    db.add(p)
+    db.flush()
+    pid = p.id
+    db.expunge_all()
+
+    with sql_statements() as statements:
+        loaded = db.get(Person, pid)
+        assert loaded is not None
+        assert len(statements) == 1
+        assert not any("person_alias_link" in s for s in statements)
+        with pytest.raises(InvalidRequestError):
+            _ = loaded.aliases
+
+        # opt-in loader option still works
+        db.expunge_all()
+        loaded = db.get(Person, pid, options=[selectinload(Person.aliases)])
+        assert [a.alias for a in loaded.aliases] == ["QL"]
+
+
 def test_media_person_unique_pair(db):
     m = _mk_media(db)
     p = Person(display_name="Actor One")
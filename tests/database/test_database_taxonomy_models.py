@@ -0,0 +1,65 @@
+# tests/database/test_database_taxonomy_models.py
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from hexmedia.database.models.media import MediaItem
+from hexmedia.database.models.taxonomy import MediaTag, Tag, TagGroup
+from hexmedia.domain.enums.media_kind import MediaKind
+
+
+def test_tag_get_joins_group_and_parent(db, sql_statements):
+    root = TagGroup(key="genre", display_name="Genre", path="genre")
+    grp = TagGroup(key="sub", display_name="Sub", path="genre/sub", depth=1, parent=root)
+    parent = Tag(name="Rock", slug="rock", group=grp)
+    child = Tag(name="Punk", slug="punk", group=grp, parent=parent)
+    db.add_all([root, grp, parent, child])
+    db.flush()
+    cid = child.id
+    db.expunge_all()
+
+    with sql_statements() as statements:
+        t = db.get(Tag, cid)
+        # group and parent arrive in the same SELECT: touching them emits no SQL
+        assert (t.parent.name, t.group.key) == ("Rock", "sub")
+        assert len(statements) == 1
+
+
+def test_tag_media_items_selectin_omits_parent_join(db, sql_statements):
+    m = MediaItem(kind=MediaKind.video, media_folder="000", identity_name="omitjoin0001",
+                  video_ext="mp4", title="Omit join")
+    t = Tag(name="Selectin", slug="selectin")
+    db.add_all([m, t])
+    db.flush()
+    db.add(MediaTag(media_item_id=m.id, tag_id=t.id))
+    db.flush()
+    db.expunge_all()
+
+    with sql_statements() as statements:
+        tags = db.execute(
+            select(Tag).where(Tag.slug == "selectin").options(selectinload(Tag.media_items))
+        ).unique().scalars().all()
+        assert [mi.identity_name for mi in tags[0].media_items] == ["omitjoin0001"]
+        # secondary load starts at the association table; the tag table is not re-joined
+        sql = statements[-1]
+        assert "FROM hexmedia.media_tag JOIN hexmedia.media_item" in sql
+        assert "hexmedia.tag " not in sql and "hexmedia.tag\n" not in sql
+
+
+def test_media_item_delete_leaves_link_rows_to_fk_cascade(db, sql_statements):
+    m = MediaItem(kind=MediaKind.video, media_folder="000", identity_name="cascade00001",
+                  video_ext="mp4", title="Cascade")
+    t = Tag(name="Cascade", slug="cascade")
+    db.add_all([m, t])
+    db.flush()
+    db.add(MediaTag(media_item_id=m.id, tag_id=t.id))
+    db.flush()
+    mid = m.id
+    db.expunge_all()
+
+    with sql_statements() as statements:
+        db.delete(db.get(MediaItem, mid))
+        db.flush()
+        # viewonly collections: no load of media_tag / media_person before the DELETE
+        assert not any("media_tag" in s or "media_person" in s for s in statements)
+
+    assert db.execute(select(MediaTag).where(MediaTag.media_item_id == mid)).first() is None
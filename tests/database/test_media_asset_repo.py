@@ -0,0 +1,47 @@
+# tests/database/test_media_asset_repo.py
+from hexmedia.database.models.media import MediaItem
+from hexmedia.database.repos.media_asset_repo import SqlAlchemyMediaAssetRepo
+from hexmedia.domain.enums.asset_kind import AssetKind
+from hexmedia.domain.enums.media_kind import MediaKind
+
+
+def _mk_media(session, folder="000", name="asset0000001", ext="mp4"):
+    m = MediaItem(kind=MediaKind.video, media_folder=folder, identity_name=name, video_ext=ext)
+    session.add(m)
+    session.flush()
+    return m
+
+
+def test_upsert_inserts_then_updates_in_place(db):
+    m = _mk_media(db)
+    repo = SqlAlchemyMediaAssetRepo(db)
+
+    a1 = repo.upsert(media_item_id=m.id, kind=AssetKind.thumb, rel_path="assets/thumb.jpg",
+                     width=320, height=180)
+    assert a1.id is not None and a1.rel_path == "assets/thumb.jpg"
+
+    a2 = repo.upsert(media_item_id=m.id, kind=AssetKind.thumb, rel_path="assets/thumb.png",
+                     width=640, height=360)
+    assert a2.id == a1.id
+    assert (a2.rel_path, a2.width, a2.height) == ("assets/thumb.png", 640, 360)
+    assert len(repo.list_by_media(m.id)) == 1
+
+
+def test_upsert_many_single_statement_last_row_wins(db):
+    m = _mk_media(db, name="asset0000002")
+    repo = SqlAlchemyMediaAssetRepo(db)
+    existing = repo.upsert(media_item_id=m.id, kind=AssetKind.thumb, rel_path="old.jpg")
+
+    ids = repo.upsert_many([
+        {"media_item_id": m.id, "kind": AssetKind.thumb, "rel_path": "a.jpg"},
+        {"media_item_id": m.id, "kind": AssetKind.contact_sheet, "rel_path": "sheet.png",
+         "width": 1200, "height": 675},
+        {"media_item_id": m.id, "kind": AssetKind.thumb, "rel_path": "b.jpg"},
+    ])
+    assert len(ids) == 2 and existing.id in ids
+
+    by_kind = {a.kind: a for a in repo.list_by_media(m.id)}
+    db.refresh(by_kind[AssetKind.thumb])
+    assert by_kind[AssetKind.thumb].rel_path == "b.jpg"
+    assert by_kind[AssetKind.contact_sheet].width == 1200
+    assert repo.upsert_many([]) == []
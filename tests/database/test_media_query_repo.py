@@ -2,9 +2,15 @@
 from __future__ import annotations
 
 from uuid import uuid4
-from sqlalchemy import select
 
-from hexmedia.database.models.media import MediaItem as DBMediaItem, MediaAsset as DBMediaAsset
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import InvalidRequestError
+
+from hexmedia.database.models.media import (
+    MediaItem as DBMediaItem, MediaAsset as DBMediaAsset, REFRESH_MEDIA_BUCKET_COUNTS,
+)
+from hexmedia.database.models.person import MediaPerson as DBMediaPerson, Person as DBPerson
 from hexmedia.database.repos.media_query import MediaQueryRepo
 from hexmedia.domain.entities.media_item import MediaIdentity
 from hexmedia.domain.enums.media_kind import MediaKind
@@ -90,3 +96,171 @@ def test_find_video_candidates_for_thumbs_respects_regenerate_and_assets(db):
     all_cands = repo.find_video_candidates_for_thumbs(limit=10, regenerate=True)
     all_ids = {mid for (mid, _rel, _file) in all_cands}
     assert {str(i_full.id), str(i_thumb_only.id), str(i_none.id)}.issubset(all_ids)
+
+
+def test_iter_media_folders_one_row_per_item(db):
+    repo = MediaQueryRepo(db)
+    db.add_all([_mk_item("20", "folderrow0001"), _mk_item("20", "folderrow0002"), _mk_item("21", "folderrow0003")])
+    db.flush()
+
+    folders = [mf for mf in repo.iter_media_folders() if mf in ("20", "21")]
+    assert sorted(folders) == ["20", "20", "21"]
+
+
+def test_count_by_bucket_is_exact_and_snapshot_follows_refresh(db):
+    repo = MediaQueryRepo(db)
+    nested = _mk_item("30/sub", "bucketview002")
+    db.add_all([_mk_item("30", "bucketview001"), nested, _mk_item("31", "bucketview003")])
+    db.flush()
+    assert nested.bucket == "30"  # generated column
+    # plain sessions carry no refresh hooks; only factories opted in via install_bucket_count_refresh
+    assert "hexmedia.media_buckets_dirty" not in db.info
+
+    # exact: sees the flushed rows without any view refresh
+    counts = repo.count_media_items_by_bucket()
+    assert counts["30"] == 2 and counts["31"] == 1
+
+    assert "30" not in repo.bucket_counts_snapshot()
+    db.execute(REFRESH_MEDIA_BUCKET_COUNTS)
+    snap = repo.bucket_counts_snapshot()
+    assert snap["30"] == 2 and snap["31"] == 1
+
+
+@pytest.mark.threaded
+def test_bucket_refresh_debounces_a_burst_of_commits(db_engine, monkeypatch):
+    import time
+
+    from sqlalchemy import delete
+    from sqlalchemy.orm import sessionmaker
+
+    from hexmedia.database.repos import bucket_counts
+
+    monkeypatch.setattr(bucket_counts, "_BUCKET_REFRESH_DELAY_SEC", 0.2)
+    factory = sessionmaker(bind=db_engine)
+    bucket_counts.install_bucket_count_refresh(factory)
+    bucket_counts.install_bucket_count_refresh(factory)  # idempotent
+    refreshes = []
+    listener = lambda _c, _cur, stmt, *_: refreshes.append(stmt) if stmt.startswith("REFRESH") else None  # noqa: E731
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        with factory() as s:
+            for i in range(3):
+                s.add(_mk_item("35", f"debounce{i:04d}"))
+                s.flush()
+                # the flush marks the session so its commit schedules a view refresh
+                assert s.info.get("hexmedia.media_buckets_dirty") is True
+                s.commit()
+        time.sleep(1.0)
+        assert len(refreshes) == 1
+        with factory() as s:
+            assert MediaQueryRepo(s).bucket_counts_snapshot()["35"] == 3
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+        with db_engine.begin() as conn:
+            conn.execute(delete(DBMediaItem).where(DBMediaItem.media_folder == "35"))
+            conn.execute(REFRESH_MEDIA_BUCKET_COUNTS)
+
+
+def test_get_many_by_identity_one_query(db, sql_statements):
+    repo = MediaQueryRepo(db)
+    db.add_all([_mk_item("40", "manyident001"), _mk_item("40", "manyident002", ext="mkv")])
+    db.flush()
+
+    idents = [
+        MediaIdentity(media_folder="40", identity_name="manyident001", video_ext="mp4"),
+        MediaIdentity(media_folder="40", identity_name="manyident002", video_ext="mkv"),
+        MediaIdentity(media_folder="40", identity_name="manyident002", video_ext="mp4"),  # no such row
+    ]
+    with sql_statements() as statements:
+        found = repo.get_many_by_identity(idents)
+
+    assert len(statements) == 1
+    assert set(found) == {("40", "manyident001", "mp4"), ("40", "manyident002", "mkv")}
+    assert found[("40", "manyident002", "mkv")].video_ext == "mkv"
+    assert repo.get_many_by_identity([]) == {}
+
+
+def test_list_media_items_maps_core_rows_without_orm_instances(db):
+    repo = MediaQueryRepo(db)
+    db.add(_mk_item("41", "corerows0001"))
+    db.flush()
+    db.expunge_all()
+
+    out = repo.list_media_items(limit=500, offset=0)
+    assert ("41", "corerows0001", "mp4") in {x.identity_key() for x in out}
+    assert not any(isinstance(o, DBMediaItem) for o in db.identity_map.values())
+
+
+def test_list_media_by_bucket_eager_loads_requested_includes(db, sql_statements):
+    repo = MediaQueryRepo(db)
+    a = _mk_item("042", "bucketincl01")
+    db.add(a)
+    db.flush()
+    db.add(DBMediaAsset(media_item_id=a.id, kind=AssetKind.thumb, rel_path="assets/thumb.png"))
+    db.flush()
+    db.expunge_all()
+
+    with sql_statements() as statements:
+        rows = repo.list_media_by_bucket("042", {"assets", "ratings"})
+        assert [r.identity_name for r in rows] == ["bucketincl01"]
+        assert [x.rel_path for x in rows[0].assets] == ["assets/thumb.png"]
+        assert rows[0].rating is None
+        with pytest.raises(InvalidRequestError):
+            rows[0].tags  # not requested: raiseload instead of a lazy SELECT
+
+    # items + joined rating, then one SELECT ... IN for the assets; no lazy loads afterwards
+    assert len(statements) == 2
+
+    db.add(DBPerson(display_name="Bucket Include"))
+    db.flush()
+    person = db.execute(select(DBPerson).where(DBPerson.display_name == "Bucket Include")).scalar_one()
+    db.add(DBMediaPerson(media_item_id=a.id, person_id=person.id))
+    db.flush()
+    db.expunge_all()
+    with sql_statements() as statements:
+        rows = repo.list_media_by_bucket("042", {"persons"})
+        assert [p.display_name for p in rows[0].people] == ["Bucket Include"]
+
+    # items, then one SELECT ... IN for the people; aliases are not loaded
+    assert len(statements) == 2
+
+
+def test_find_video_candidates_for_thumbs_missing_both(db):
+    i_thumb_only = _mk_item("11", "boththumb01")
+    i_none = _mk_item("11", "bothnone01")
+    db.add_all([i_thumb_only, i_none])
+    db.flush()
+    db.add(DBMediaAsset(media_item_id=i_thumb_only.id, kind=AssetKind.thumb, rel_path="assets/thumb.png"))
+    db.flush()
+
+    cands = MediaQueryRepo(db).find_video_candidates_for_thumbs(limit=100, regenerate=False, missing="both")
+    ids = {mid for (mid, _rel, _file) in cands}
+    assert str(i_none.id) in ids
+    assert str(i_thumb_only.id) not in ids
+
+
+def test_probe_identity_and_hash_single_statement(db):
+    repo = MediaQueryRepo(db)
+    a = _mk_item("43", "probeboth001")
+    a.hash_sha256 = "ab" * 32
+    db.add(a)
+    db.flush()
+    ident = MediaIdentity(media_folder="43", identity_name="probeboth001", video_ext="mp4")
+    other = MediaIdentity(media_folder="43", identity_name="probeboth002", video_ext="mp4")
+
+    item, seen = repo.probe_identity_and_hash(ident, "cd" * 32)
+    assert item is not None and item.identity_name == "probeboth001" and seen is False
+
+    item, seen = repo.probe_identity_and_hash(other, "ab" * 32)
+    assert item is None and seen is True
+
+
+def test_column_reads_bypass_orm_autoflush(db):
+    repo = MediaQueryRepo(db)
+    pending = _mk_item("44", "noflush00001")
+    db.add(pending)
+
+    repo.count_media_items()
+    repo.exists_hash("ef" * 32)
+    list(repo.iter_media_folders())
+    assert pending in db.new  # nothing was flushed by the reads
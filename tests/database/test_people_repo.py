@@ -60,3 +60,17 @@ def test_repo_crud_and_linking(db):
     repo.delete(p.id)
     db.flush()
     assert repo.get(p.id) is None
+
+
+def test_link_many_single_insert_skips_existing(db):
+    repo = SqlAlchemyPeopleRepo(db)
+    a = repo.create(display_name="Link Many A")
+    b = repo.create(display_name="Link Many B")
+    db.flush()
+    m = _mk_media(db, name="linkmany0001")
+    repo.link(media_item_id=m.id, person_id=a.id)
+
+    added = repo.link_many(media_item_id=m.id, person_ids=[a.id, b.id, b.id])
+    assert added == [b.id]
+    assert {x.id for x in repo.list_by_media(m.id)} == {a.id, b.id}
+    assert repo.link_many(media_item_id=m.id, person_ids=[]) == []
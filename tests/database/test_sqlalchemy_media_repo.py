@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import pytest
+from dataclasses import replace
 from uuid import UUID
 
 from hexmedia.database.repos.media_repo import SqlAlchemyMediaRepo
@@ -55,9 +56,7 @@ def test_update_and_delete_media_item(db):
     dom = repo.get_by_id(orm.id)
     assert dom is not None
 
-    dom.title = "A Title"
-    dom.watched = True
-    dom.favorite = True
+    dom = replace(dom, title="A Title", watched=True, favorite=True)
 
     updated = repo.update_media_item(dom)
     assert updated.title == "A Title"
@@ -67,3 +66,55 @@ def test_update_and_delete_media_item(db):
     # delete
     repo.delete_media_item(orm.id)
     assert db.get(DBMediaItem, orm.id) is None
+
+
+def test_get_by_id_reuses_mapping_until_row_changes(db):
+    repo = SqlAlchemyMediaRepo(db)
+    orm = repo.create_media_item(_domain_item(folder="23", name="cache0000001"))
+    db.flush()
+    db.refresh(orm)
+
+    first = repo.get_by_id(orm.id)
+    assert repo.get_by_id(orm.id) is first
+
+    # unflushed change: converted fresh, not served from the cache
+    orm.title = "Changed"
+    assert repo.get_by_id(orm.id).title == "Changed"
+
+    # flushed: the trigger bumps last_updated, so the row maps under a new key
+    db.flush()
+    again = repo.get_by_id(orm.id)
+    assert again is not first and again.title == "Changed"
+    assert again.last_updated > first.last_updated
+
+
+def test_bulk_create_media_items_returns_rows_in_input_order(db):
+    repo = SqlAlchemyMediaRepo(db)
+    items = [_domain_item(folder="24", name=f"bulkrow{i:05d}") for i in range(3)]
+
+    rows = repo.bulk_create_media_items(items)
+    assert [r.identity_name for r in rows] == ["bulkrow00000", "bulkrow00001", "bulkrow00002"]
+    assert all(r.id is not None and r.date_created is not None for r in rows)
+    assert repo.bulk_create_media_items([]) == []
+
+
+def test_exists_hashes_returns_stored_subset(db):
+    repo = SqlAlchemyMediaRepo(db)
+    stored = replace(_domain_item(folder="25", name="hashbatch001"), hash_sha256="1a" * 32)
+    repo.create_media_item(stored)
+
+    assert repo.exists_hashes(["1a" * 32, "2b" * 32, "1a" * 32]) == {"1a" * 32}
+    assert repo.exists_hashes([]) == set()
+
+
+def test_get_by_id_reads_columns_when_not_in_session(db):
+    repo = SqlAlchemyMediaRepo(db)
+    orm = repo.create_media_item(_domain_item(folder="26", name="coreget00001"))
+    db.flush()
+    item_id = orm.id
+    db.expunge_all()
+
+    dom = repo.get_by_id(item_id)
+    assert dom is not None and dom.identity_name == "coreget00001"
+    assert not any(isinstance(o, DBMediaItem) for o in db.identity_map.values())
+    assert repo.get_by_id(UUID(int=0)) is None
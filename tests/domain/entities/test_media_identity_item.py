@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from hexmedia.domain.entities.media_item import MediaIdentity, MediaItem
 from hexmedia.domain.enums.media_kind import MediaKind
 
@@ -118,3 +119,11 @@ def test_media_item_requires_identity_or_triplet():
     # No identity and no triplet -> error
     with pytest.raises(ValueError):
         MediaItem(kind=MediaKind.video)  # type: ignore[call-arg]
+
+
+def test_media_item_is_frozen():
+    ident = MediaIdentity(media_folder="003", identity_name="222222222222", video_ext="mp4")
+    item = MediaItem(kind=MediaKind.video, identity=ident)
+    with pytest.raises(FrozenInstanceError):
+        item.title = "nope"  # type: ignore[misc]
+    assert replace(item, title="ok").title == "ok" and item.title is None
@@ -168,6 +168,23 @@ def test_people_crud_and_alias_flow(api_client):
     assert r.status_code in (200, 204), r.text
 
 
+
+def test_alias_reuse_matches_db_normalization(api_client):
+    # U+00A0 and non-ASCII case: Python's split()/lower() and Postgres' \s/lower() can
+    # disagree, so re-adding the same alias must match on the DB's own normalization
+    alias = "Zoë\u00a0ÅBERG"
+    pids = []
+    for name in ("Alias Reuse One", "Alias Reuse Two"):
+        r = api_client.post("/api/people", json={"display_name": name})
+        assert r.status_code == 201, r.text
+        pids.append(r.json()["id"])
+
+    r1 = api_client.post(f"/api/people/{pids[0]}/aliases", json={"alias": alias})
+    assert r1.status_code in (200, 201), r1.text
+    r2 = api_client.post(f"/api/people/{pids[1]}/aliases", json={"alias": alias})
+    assert r2.status_code in (200, 201), r2.text
+    assert r2.json()["id"] == r1.json()["id"]
+
 def test_media_person_linking(api_client, db_engine):
     # Create a person via API
     r = api_client.post("/api/people", json={"display_name": "Actor X"})
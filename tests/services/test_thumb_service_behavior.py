@@ -1,3 +1,5 @@
+import threading
+import time
 import uuid
 from types import SimpleNamespace
 from typing import Any, Dict, List, Tuple
@@ -16,12 +18,30 @@ class _FakeWorker:
     process_calls: List[Tuple[str, str, str]] = []
     # behavior map: index -> either dict result or Exception to raise
     scripted_results: Dict[int, Any] = {}
+    # concurrency tracking: process_one sleeps `delay` and records the peak overlap
+    delay: float = 0.0
+    active: int = 0
+    peak: int = 0
+    _lock = threading.Lock()
 
     def __init__(self, **kwargs):
         type(self).instances.append(self)
         type(self).ctor_args.append(dict(kwargs))
 
     def process_one(self, media_item_id: str, rel_dir: str, fname: str):
+        cls = type(self)
+        with cls._lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        try:
+            if cls.delay:
+                time.sleep(cls.delay)
+            return self._process_one(media_item_id, rel_dir, fname)
+        finally:
+            with cls._lock:
+                cls.active -= 1
+
+    def _process_one(self, media_item_id: str, rel_dir: str, fname: str):
         i = len(type(self).process_calls)
         type(self).process_calls.append((media_item_id, rel_dir, fname))
         if i in type(self).scripted_results:
@@ -39,6 +59,8 @@ class _FakeWorker:
         cls.ctor_args.clear()
         cls.process_calls.clear()
         cls.scripted_results.clear()
+        cls.delay = 0.0
+        cls.active = cls.peak = 0
 
 
 # ----- Test 1: aggregates errors/details & counts properly --------------------
@@ -110,21 +132,17 @@ class _FakeFuture:
         self._result = result
     def result(self):
         return self._result
+    def add_done_callback(self, fn):
+        fn(self)  # already done
 
 class _CapturingExecutor:
-    """Minimal executor stand-in that records max_workers and runs tasks synchronously."""
+    """Minimal thread-manager stand-in that records max_workers and runs tasks synchronously."""
     captured_max_workers: List[int] = []
 
-    def __init__(self, max_workers: int):
+    def __init__(self, name: str, max_workers: int, **kwargs):
         type(self).captured_max_workers.append(max_workers)
         self._futures: List[_FakeFuture] = []
 
-    def __enter__(self):
-        return self
-
-    def __exit__(self, exc_type, exc, tb):
-        return False
-
     def submit(self, fn, *args, **kwargs):
         # run immediately, capture the result
         try:
@@ -146,8 +164,8 @@ def test_thumb_service_respects_max_workers_cap(monkeypatch, db_engine):
     _FakeWorker._reset()
     monkeypatch.setattr(svc_mod, "ThumbWorker", _FakeWorker, raising=True)
 
-    # override ThreadPoolExecutor & as_completed used in the service module
-    monkeypatch.setattr(svc_mod, "ThreadPoolExecutor", _CapturingExecutor, raising=True)
+    # override the shared pool factory & as_completed used in the service module
+    monkeypatch.setattr(svc_mod, "get_thread_manager", _CapturingExecutor, raising=True)
     monkeypatch.setattr(svc_mod, "as_completed", _as_completed_passthrough, raising=True)
 
     # pretend there are many candidates; we only need a handful
@@ -190,6 +208,64 @@ def test_thumb_service_respects_max_workers_cap(monkeypatch, db_engine):
     assert len(_FakeWorker.process_calls) == 5
 
 
+def test_thumb_service_caps_in_flight_at_requested_workers(monkeypatch, db_engine):
+    from hexmedia.common.concurrency.thread_manager import ThreadManager
+
+    _FakeWorker._reset()
+    _FakeWorker.delay = 0.02
+    monkeypatch.setattr(svc_mod, "ThumbWorker", _FakeWorker, raising=True)
+
+    # a private pool sized like the shared one would be, so earlier tests can't skew it
+    pools: List[ThreadManager] = []
+
+    def _pool(name: str, max_workers: int, **kwargs):
+        pools.append(ThreadManager(name=name, max_workers=max_workers, **kwargs))
+        return pools[-1]
+
+    monkeypatch.setattr(svc_mod, "get_thread_manager", _pool, raising=True)
+
+    def _fake_candidates(self, *, limit: int, regenerate: bool):
+        return [(str(uuid.uuid4()), "00/one", "one.mp4")] * 6
+
+    monkeypatch.setattr(
+        MediaQueryRepo, "find_video_candidates_for_thumbs", _fake_candidates, raising=True
+    )
+
+    cfg = SimpleNamespace(
+        media_root=None,
+        thumb_format="jpg",
+        collage_format="png",
+        thumb_width=320,
+        collage_tile_width=160,
+        upscale_policy="never",
+        max_thumb_workers=4,
+    )
+
+    SessionLocal = sessionmaker(bind=db_engine, future=True)
+    try:
+        with SessionLocal() as db:
+            svc = ThumbService(db)
+            svc.cfg = cfg  # type: ignore[attr-defined]
+            rep = svc.run(
+                limit=6,
+                regenerate=False,
+                workers=1,  # below the config cap: the pool has 4 threads, this run uses 1
+                include_missing=False,
+                thumb_format="jpg",
+                collage_format="png",
+                thumb_width=320,
+                tile_width=160,
+                upscale_policy="never",
+            )
+    finally:
+        for p in pools:
+            p.shutdown()
+
+    assert [p._max_workers for p in pools] == [4]
+    assert rep.generated == 6
+    assert _FakeWorker.peak == 1
+
+
 # ----- Test 3: uses config defaults when options are missing ------------------
 
 def test_thumb_service_uses_config_defaults_when_options_missing(monkeypatch, db_engine):